@@ -4,17 +4,23 @@ Updated to use Docker SDK instead of systemd/subprocess
 """
 
 from flask import Flask, render_template, request, redirect, jsonify, flash, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException
 import os
 import logging
+import logging.handlers
+import queue
+import atexit
 import time
 import json
-import traceback
 import re
-from datetime import datetime
+import hashlib
 import threading
+import socket
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 import psutil
-from .manager_logic import PersonaManager
-from .interface_manager import InterfaceManager
+import docker
+from .manager_logic import PersonaManager, now_iso
 
 # Diagnostics module is optional at runtime: if missing, the manager should still boot.
 _diagnostics_import_error = None
@@ -40,6 +46,39 @@ except Exception as e:
             }],
         }
 
+# orjson is optional: when installed, JSON responses are encoded by its C extension.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# flask-compress is optional: when installed, JSON/HTML/CSS/JS responses are gzip/brotli encoded.
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, falling back to Flask's default() for unknown types"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # jsonify() path: hand orjson's bytes straight to the response, no str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 # Determine base directory - handle both development and container environments
 if os.path.exists("/app"):
     # Running in container
@@ -51,12 +90,16 @@ else:
 # Load version
 VERSION_FILE = os.path.join(BASE_DIR, "VERSION")
 VERSION = "2.0.0"  # Default fallback
-if os.path.exists(VERSION_FILE):
+VERSION_MTIME = int(time.time())  # Last-Modified for /api/version when the file is absent
+try:
+    _version_fd = os.open(VERSION_FILE, os.O_RDONLY)
     try:
-        with open(VERSION_FILE, 'r') as f:
-            VERSION = f.read().strip()
-    except:
-        pass
+        VERSION = os.read(_version_fd, 64).decode().strip() or VERSION
+        VERSION_MTIME = int(os.fstat(_version_fd).st_mtime)
+    finally:
+        os.close(_version_fd)
+except (OSError, UnicodeDecodeError):
+    pass
 
 # Configure Flask with explicit template and static folders
 template_dir = os.path.join(BASE_DIR, "templates")
@@ -67,6 +110,29 @@ app = Flask(__name__,
             static_folder=static_dir,
             static_url_path='/static')
 app.secret_key = 'wifi-test-dashboard-secret-key'
+# No route handles OPTIONS itself; skip registering the automatic OPTIONS responder on each rule
+app.config['PROVIDE_AUTOMATIC_OPTIONS'] = False
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+if Compress is not None:
+    # flask-compress 1.19+ passes weak ETags (/status, /api/interfaces) through unchanged and
+    # re-evaluates If-None-Match after rewriting strong ones (the dashboard shell, /static/*) to
+    # "<etag>:gzip", so 304s keep working; it also compresses streamed NDJSON without buffering.
+    # Older releases ignore this setting and break both, hence the >=1.19 pin in Dockerfile.manager
+    app.config['COMPRESS_EVALUATE_CONDITIONAL_REQUEST'] = True
+    app.config['COMPRESS_MIMETYPES'] = ['application/json', 'application/x-ndjson', 'text/html',
+                                        'text/css', 'application/javascript']
+    app.config['COMPRESS_LEVEL'] = 5
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+
+# /api/version is invariant for the life of the process: encode the body and its ETag once
+_VERSION_BODY = f"{app.json.dumps({'version': VERSION})}\n".encode()
+_VERSION_ETAG = hashlib.blake2b(_VERSION_BODY, digest_size=8).hexdigest()
+# /static/* is served by Flask's built-in handler (or a reverse proxy, see ARCHITECTURE.md).
+# Assets are referenced with ?v=<VERSION>, so browsers may cache them long-term; the
+# dashboard shell itself is sent with max_age=0 so a new version is picked up immediately.
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 7 * 24 * 3600
 
 # Configuration paths
 CONFIG_FILE = os.path.join(BASE_DIR, "configs", "ssid.conf")
@@ -81,21 +147,82 @@ os.makedirs(STATE_DIR, exist_ok=True)
 os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
 
 # Setup logging FIRST (before manager initialization)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(os.path.join(LOG_DIR, "manager.log")),
-        logging.StreamHandler()
-    ]
+# Request threads only enqueue records; a background listener owns the blocking file/stream writes.
+# The file sink is size-bounded and batched: INFO records are written in blocks of 512,
+# while ERROR and above flush immediately.
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_rotating_handler = logging.handlers.RotatingFileHandler(
+    os.path.join(LOG_DIR, "manager.log"),
+    maxBytes=10 * 1024 * 1024,
+    backupCount=5,
+    delay=True
+)
+_rotating_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+_file_log_buffer = logging.handlers.MemoryHandler(
+    capacity=512,
+    flushLevel=logging.ERROR,
+    target=_rotating_handler
 )
+_log_handlers = [_file_log_buffer, _stream_handler]
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records untouched, leaving message/traceback formatting to the listener thread"""
+
+    def prepare(self, record):
+        # The stock prepare() formats eagerly so records can be pickled; this queue never leaves the process
+        return record
+
+
+class _FlushRequest:
+    """Queue marker: the listener flushes the file buffer when it reaches it, then sets `done`"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that also services _FlushRequest markers in queue order"""
+
+    def handle(self, record):
+        if isinstance(record, _FlushRequest):
+            _file_log_buffer.flush()
+            record.done.set()
+            return
+        super().handle(record)
+
+
+_log_queue = queue.Queue(-1)
+_root_logger = logging.getLogger()
+_root_logger.addHandler(_InProcessQueueHandler(_log_queue))
+_root_logger.setLevel(logging.INFO)
+_log_listener = _FlushingQueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+def _flush_file_log(timeout=0.5):
+    """Write every record logged so far to manager.log, waiting at most `timeout` seconds"""
+    # Records still queued ahead of the marker are handed to the buffer first, so the flush covers them
+    marker = _FlushRequest()
+    _log_queue.put_nowait(marker)
+    return marker.done.wait(timeout)
+
 logger = logging.getLogger(__name__)
+if not os.path.exists(static_dir):
+    logger.warning(f"Static directory not found: {static_dir}")
+
+# Directory snapshots reported by /debug (taken once; these only change on redeploy)
+_template_files = os.listdir(template_dir) if os.path.exists(template_dir) else []
+_static_files = os.listdir(static_dir) if os.path.exists(static_dir) else []
 if _diagnostics_import_error:
     logger.warning(f"Diagnostics module unavailable at startup: {_diagnostics_import_error}")
 
 # Initialize managers with error handling (lazy initialization)
 persona_manager = None
 interface_manager = None
+_init_lock = threading.Lock()
 
 def initialize_managers():
     """Lazy initialization of managers - called on first use"""
@@ -104,16 +231,22 @@ def initialize_managers():
     if persona_manager is not None and interface_manager is not None:
         return True  # Already initialized
     
-    try:
-        logger.info("Initializing PersonaManager and InterfaceManager...")
-        persona_manager = PersonaManager(state_dir=STATE_DIR)
-        interface_manager = InterfaceManager()
-        logger.info("✅ Managers initialized successfully")
-        return True
-    except Exception as e:
-        logger.exception(f"Failed to initialize managers: {e}")
-        logger.error("Application will run in limited mode - Docker features unavailable")
-        return False
+    # Concurrent cold-start requests must not each build their own managers
+    with _init_lock:
+        if persona_manager is not None and interface_manager is not None:
+            return True
+        try:
+            logger.info("Initializing PersonaManager and InterfaceManager...")
+            manager = PersonaManager(state_dir=STATE_DIR)
+            # Reuse the PersonaManager's instance rather than constructing a second one
+            interface_manager = manager.interface_manager
+            persona_manager = manager
+            logger.info("✅ Managers initialized successfully")
+            return True
+        except Exception as e:
+            logger.exception(f"Failed to initialize managers: {e}")
+            logger.error("Application will run in limited mode - Docker features unavailable")
+            return False
 
 # Try to initialize, but don't fail if Docker isn't available
 try:
@@ -130,206 +263,501 @@ _state = {
 }
 _MB = 1024 * 1024
 
+# Shared pool for fanning out per-container Docker log fetches
+_log_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="logagg")
+
+# Parsed SSID config, keyed on the file's mtime so unchanged reads are a single stat()
+_config_cache = {
+    "mtime": None,
+    "value": ("", ""),
+}
+
 
 def read_config():
-    """Read SSID configuration"""
-    ssid, password = "", ""
+    """Read SSID configuration (cached until the file's mtime changes)"""
     try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                lines = [line.strip() for line in f.readlines()]
-                if len(lines) >= 2:
-                    ssid, password = lines[0], lines[1]
+        try:
+            mtime = os.stat(CONFIG_FILE).st_mtime_ns
+        except FileNotFoundError:
+            return "", ""
+
+        with _state_lock:
+            if _config_cache["mtime"] == mtime:
+                return _config_cache["value"]
+
+        # The file is two short lines; one bounded read avoids buffering anything beyond them
+        with open(CONFIG_FILE, 'r') as f:
+            lines = f.read(1024).splitlines()
+        # Anything short of both lines (e.g. a truncated file) counts as unconfigured
+        ssid, password = "", ""
+        if len(lines) >= 2:
+            ssid, password = lines[0].strip(), lines[1].strip()
+
+        with _state_lock:
+            _config_cache["mtime"] = mtime
+            _config_cache["value"] = (ssid, password)
         return ssid, password
     except Exception as e:
         logger.error(f"Error reading config: {e}")
         return "", ""
 
 
+# Host IP shown in /status; resolved via psutil and cached to avoid per-request lookups
+_ip_cache = {
+    "ts": 0.0,
+    "value": "Unknown",
+}
+
+
+def _get_ip_cached(ttl=10):
+    """Return the first non-loopback IPv4 address, cached for ttl seconds"""
+    now = time.monotonic()
+    with _state_lock:
+        if _ip_cache["ts"] and now - _ip_cache["ts"] < ttl:
+            return _ip_cache["value"]
+
+    ip_address = "Unknown"
+    try:
+        for iface, addrs in psutil.net_if_addrs().items():
+            if iface == "lo":
+                continue
+            for addr in addrs:
+                if addr.family == socket.AF_INET and not addr.address.startswith("127."):
+                    ip_address = addr.address
+                    break
+            if ip_address != "Unknown":
+                break
+    except Exception as e:
+        logger.debug(f"Could not determine host IP address: {e}")
+
+    with _state_lock:
+        _ip_cache["ts"] = now
+        _ip_cache["value"] = ip_address
+    return ip_address
+
+
+# Steady-state /status polls: "rev" is bumped whenever persona/interface caches are invalidated.
+# While the Docker event watcher is connected, a poll whose inputs (rev, config, IP) match the
+# last build within _PERSONAS_EVENT_TTL, and whose If-None-Match holds that build's ETag, gets
+# a 304 without listing containers or scanning interfaces.
+_status_fast = {
+    "rev": 0,
+    "key": None,
+    "etag": None,
+    "ts": 0.0,
+}
+
+
+def _list_interfaces_cached():
+    """interface_manager.list_available_interfaces() (TTL-cached there); returns a copy callers may mutate"""
+    return interface_manager.list_available_interfaces(include_ethernet=True)
+
+
+def _invalidate_interfaces_cache():
+    """Drop the cached interface scan (interfaces moved in or out of a container)"""
+    if interface_manager is not None:
+        interface_manager.invalidate_interfaces_cache()
+    with _state_lock:
+        _status_fast["rev"] += 1
+
+
+# Management (default-route) interface, read from /proc/net/route and cached briefly
+_PROTECTED_IFACE_TTL = 5.0
+_protected_iface_cache = {
+    "ts": 0.0,
+    "value": None,
+}
+
+
+def _get_protected_iface():
+    """Return the default-route interface (lowest metric) so it is never offered for assignment"""
+    now = time.monotonic()
+    with _state_lock:
+        if _protected_iface_cache["ts"] and now - _protected_iface_cache["ts"] < _PROTECTED_IFACE_TTL:
+            return _protected_iface_cache["value"]
+
+    protected_iface = None
+    try:
+        best_metric = None
+        with open("/proc/net/route", 'r') as f:
+            next(f, None)  # header
+            for line in f:
+                fields = line.split()
+                # Iface Destination Gateway Flags RefCnt Use Metric Mask ...
+                if len(fields) >= 8 and fields[1] == "00000000" and fields[7] == "00000000":
+                    metric = int(fields[6])
+                    if best_metric is None or metric < best_metric:
+                        best_metric = metric
+                        protected_iface = fields[0]
+    except Exception as e:
+        logger.debug(f"Could not determine protected interface: {e}")
+
+    with _state_lock:
+        _protected_iface_cache["ts"] = now
+        _protected_iface_cache["value"] = protected_iface
+    return protected_iface
+
+
+# Single-flight persona listing: concurrent polls share one Docker round-trip, plus a short TTL
+_PERSONAS_CACHE_TTL = 0.5
+_personas_lock = threading.Lock()
+_personas_flight = {
+    "event": None,
+    "ts": 0.0,
+    "value": None,
+}
+
+
+def _list_personas_coalesced():
+    """persona_manager.list_personas() with request coalescing for concurrent callers"""
+    # With the event watcher connected, lifecycle changes invalidate the cache directly,
+    # so it only needs to expire to refresh log-derived health.
+    ttl = _PERSONAS_EVENT_TTL if _events_watcher["connected"] else _PERSONAS_CACHE_TTL
+    with _personas_lock:
+        value = _personas_flight["value"]
+        if value is not None and time.monotonic() - _personas_flight["ts"] < ttl:
+            return value
+        event = _personas_flight["event"]
+        leader = event is None
+        if leader:
+            event = _personas_flight["event"] = threading.Event()
+
+    if not leader:
+        # Another request is already listing; reuse its result (or the last one if it is slow)
+        event.wait(timeout=2)
+        with _personas_lock:
+            value = _personas_flight["value"]
+        if value is not None:
+            return value
+        return persona_manager.list_personas()
+
+    try:
+        value = persona_manager.list_personas()
+        with _personas_lock:
+            _personas_flight["value"] = value
+            _personas_flight["ts"] = time.monotonic()
+        return value
+    finally:
+        with _personas_lock:
+            _personas_flight["event"] = None
+        event.set()
+
+
+def _invalidate_personas_cache():
+    """Drop the cached persona listing after a start/stop"""
+    if persona_manager is not None:
+        persona_manager.invalidate_container_cache()
+    with _personas_lock:
+        _personas_flight["value"] = None
+    with _state_lock:
+        _status_fast["rev"] += 1
+
+
+# Docker event stream watcher: one long-lived connection replaces re-listing containers on a timer
+_PERSONAS_EVENT_TTL = 5.0
+_PERSONA_EVENTS = ["create", "start", "die", "destroy", "rename"]
+_events_watcher = {
+    "connected": False,
+}
+
+
+def _set_container_events_live(live):
+    """Let the PersonaManager keep its container listing until an event invalidates it"""
+    if persona_manager is not None:
+        persona_manager.container_events_live = live
+
+
+def _watch_persona_events():
+    """Background loop invalidating cached persona/interface views on persona container events"""
+    while True:
+        try:
+            client = docker.from_env()
+            events = client.events(
+                decode=True,
+                filters={"type": "container", "event": _PERSONA_EVENTS}
+            )
+            _events_watcher["connected"] = True
+            _set_container_events_live(True)
+            for event in events:
+                name = event.get("Actor", {}).get("Attributes", {}).get("name", "")
+                if name.startswith("persona-"):
+                    # Also covers managers initialized after the stream connected
+                    _set_container_events_live(True)
+                    _invalidate_personas_cache()
+                    _invalidate_interfaces_cache()
+        except Exception as e:
+            logger.debug(f"Docker event watcher disconnected: {e}")
+        _events_watcher["connected"] = False
+        _set_container_events_live(False)
+        # Cached views fall back to their short TTLs until the stream is re-established
+        _invalidate_personas_cache()
+        time.sleep(10)
+
+
+threading.Thread(target=_watch_persona_events, name="persona-events", daemon=True).start()
+
+
+_MAX_LOG_TAIL = 100_000
+_TAIL_BLOCK = 64 * 1024
+
+
+def _tail_lines(path, n):
+    """Return the last n lines of a file, reading 64 KiB blocks backwards from the end"""
+    if n <= 0:
+        return []
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        blocks = []
+        newlines = 0
+        # n lines need n+1 separators unless we reach the start of the file
+        while pos > 0 and newlines <= n:
+            read_size = min(_TAIL_BLOCK, pos)
+            pos -= read_size
+            f.seek(pos)
+            block = f.read(read_size)
+            newlines += block.count(b"\n")
+            blocks.append(block)
+    lines = b"".join(reversed(blocks)).splitlines()
+    return [line.decode('utf-8', errors='replace').rstrip() for line in lines[-n:]]
+
+
 def write_config(ssid, password):
     """Write SSID configuration"""
     try:
         os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-        with open(CONFIG_FILE, 'w') as f:
+        # Write a 0600 temp file and rename over the original so readers never see a partial file
+        tmp_path = f"{CONFIG_FILE}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
             f.write(f"{ssid}\n{password}\n")
-        os.chmod(CONFIG_FILE, 0o600)
+        os.replace(tmp_path, CONFIG_FILE)
+        # Seed the cache with what we just wrote so the next read_config() skips the re-read
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+        with _state_lock:
+            _config_cache["mtime"] = mtime
+            _config_cache["value"] = (ssid.strip(), password.strip())
         return True
     except Exception as e:
         logger.error(f"Error writing config: {e}")
         return False
 
 
-@app.route("/")
-def index():
-    """Main dashboard page"""
+# Pre-rendered dashboard shell; the page is static and populated client-side from /status
+INDEX_FILE = os.path.join(static_dir, "index.html")
+DASHBOARD_TEMPLATE = os.path.join(template_dir, "dashboard.html")
+_DASHBOARD_TEMPLATE_OK = os.path.exists(DASHBOARD_TEMPLATE)
+_index_ready = False
+
+
+def _regenerate_index():
+    """Render the dashboard shell to static/index.html via atomic rename"""
+    global _index_ready
+    if not _DASHBOARD_TEMPLATE_OK:
+        logger.error(f"Template not found at: {DASHBOARD_TEMPLATE}")
+        return False
     try:
-        ssid, _ = read_config()
-        template_path = os.path.join(app.template_folder, "dashboard.html")
-        if not os.path.exists(template_path):
-            logger.error(f"Template not found at: {template_path}")
-            return f"<h1>Error</h1><p>Template not found at: {template_path}</p><p>Template folder: {app.template_folder}</p>", 500
-        return render_template("dashboard.html", ssid=ssid, version=VERSION)
+        with app.app_context():
+            html = render_template("dashboard.html", ssid=read_config()[0], version=VERSION)
+        tmp_path = f"{INDEX_FILE}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(html)
+        os.replace(tmp_path, INDEX_FILE)
+        _index_ready = True
+        return True
     except Exception as e:
-        logger.exception(f"Error in index route: {e}")
-        return f"<h1>Error</h1><p>Failed to load dashboard: {str(e)}</p><pre>{traceback.format_exc()}</pre>", 500
+        logger.error(f"Error pre-rendering dashboard: {e}")
+        _index_ready = False
+        return False
+
+
+_regenerate_index()
+
+
+# endpoint -> (etag, unix time it was first served); the Last-Modified for dynamic payloads
+_etag_seen = {}
+
+
+def _conditional_json(payload, etag_payload=None, last_modified=None, max_age=2):
+    """
+    JSON response with a weak ETag, Last-Modified and short private caching.
+    Returns an empty 304 when If-None-Match (or, absent that, If-Modified-Since) shows the
+    client's copy is current, skipping the body encode.
+    etag_payload lets callers hash only the semantically relevant subset (e.g. without timestamps).
+    last_modified defaults to when this endpoint's ETag last changed.
+    """
+    etag_source = app.json.dumps(payload if etag_payload is None else etag_payload)
+    etag = hashlib.blake2b(etag_source.encode(), digest_size=8).hexdigest()
+    if last_modified is None:
+        with _state_lock:
+            seen = _etag_seen.get(request.endpoint)
+            if seen is None or seen[0] != etag:
+                seen = _etag_seen[request.endpoint] = (etag, int(time.time()))
+        last_modified = seen[1]
 
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains_weak(etag)
+    elif request.if_modified_since:
+        not_modified = last_modified <= request.if_modified_since.timestamp()
+    else:
+        not_modified = False
 
-@app.route("/static/<path:filename>")
-def static_files(filename):
-    """Serve static files"""
+    if not_modified:
+        response = app.response_class(status=304)
+    else:
+        body = etag_source if etag_payload is None else app.json.dumps(payload)
+        response = app.response_class(f"{body}\n", mimetype=app.json.mimetype)
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    response.cache_control.private = True
+    response.cache_control.max_age = max_age
+    return response
+
+
+@app.route("/")
+def index():
+    """Main dashboard page"""
     try:
-        static_dir = os.path.join(BASE_DIR, "manager", "static")
-        if not os.path.exists(static_dir):
-            logger.warning(f"Static directory not found: {static_dir}")
-            return "Static files not found", 404
-        response = send_from_directory(static_dir, filename)
-        # Add cache-busting headers for JS/CSS files
-        if filename.endswith(('.js', '.css')):
-            response.cache_control.no_cache = True
-            response.cache_control.must_revalidate = True
-        return response
+        if not _index_ready and not _regenerate_index():
+            if not _DASHBOARD_TEMPLATE_OK:
+                return f"<h1>Error</h1><p>Template not found at: {DASHBOARD_TEMPLATE}</p><p>Template folder: {app.template_folder}</p>", 500
+            return render_template("dashboard.html", ssid=read_config()[0], version=VERSION)
+        return send_from_directory(static_dir, "index.html", conditional=True, max_age=0)
     except Exception as e:
-        logger.exception(f"Error serving static file {filename}: {e}")
-        return f"Error: {str(e)}", 500
+        logger.exception(f"Error in index route: {e}")
+        return "<h1>Error</h1><p>Failed to load dashboard. Check logs for details.</p>", 500
 
 
 @app.route("/api/version")
 def api_version():
     """Get current version"""
-    return jsonify({"version": VERSION})
+    response = app.response_class(_VERSION_BODY, mimetype=app.json.mimetype)
+    response.set_etag(_VERSION_ETAG)
+    response.last_modified = VERSION_MTIME
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
+# /status always has this shape and key order; each request fills a shallow copy
+_STATUS_SKEL = {
+    "ssid": "",
+    "password_masked": "",
+    "personas": [],
+    "interfaces": {},
+    "system_info": {"ip_address": "", "timestamp": ""},
+    "version": VERSION,
+    "success": True
+}
 
 @app.route("/status")
 def status():
     """API endpoint for status information"""
-    try:
-        # Try to initialize managers if not already done
-        initialize_managers()
-        
-        ssid, password = read_config()
-        
-        # Get persona status
-        personas = []
-        if persona_manager:
-            try:
-                personas = persona_manager.list_personas()
-            except Exception as e:
-                logger.error(f"Error listing personas: {e}")
-        
-        # Get available interfaces
-        interfaces = {}
-        if interface_manager:
-            try:
-                interfaces = interface_manager.list_available_interfaces()
-            except Exception as e:
-                logger.error(f"Error listing interfaces: {e}")
-        
-        # Get system info
+    # Try to initialize managers if not already done
+    initialize_managers()
+    
+    config = read_config()
+    ip_address = _get_ip_cached()
+    now = time.monotonic()
+    with _state_lock:
+        key = (_status_fast["rev"], config, ip_address)
+        etag = _status_fast["etag"]
+        fresh = (_events_watcher["connected"] and _status_fast["key"] == key
+                 and now - _status_fast["ts"] < _PERSONAS_EVENT_TTL)
+    if fresh and request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        response.cache_control.private = True
+        response.cache_control.max_age = 2
+        return response
+
+    ssid, password = config
+    
+    # Get persona status
+    personas = []
+    if persona_manager:
         try:
-            import subprocess
-            ip_result = subprocess.run(['hostname', '-I'], capture_output=True, text=True, timeout=5)
-            ip_address = ip_result.stdout.strip().split()[0] if ip_result.stdout.strip() else "Unknown"
-        except:
-            ip_address = "Unknown"
-        
-        return jsonify({
-            "ssid": ssid,
-            "password_masked": "*" * len(password) if password else "",
-            "personas": personas,
-            "interfaces": interfaces,
-            "system_info": {
-                "ip_address": ip_address,
-                "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            },
-            "version": VERSION,
-            "success": True
-        })
-    except Exception as e:
-        logger.error(f"Error in status endpoint: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+            personas = _list_personas_coalesced()
+        except Exception as e:
+            logger.error(f"Error listing personas: {e}")
+    
+    # Get available interfaces
+    interfaces = {}
+    if interface_manager:
+        try:
+            interfaces = _list_interfaces_cached()
+        except Exception as e:
+            logger.error(f"Error listing interfaces: {e}")
+    
+    payload = _STATUS_SKEL.copy()
+    payload["ssid"] = ssid
+    payload["password_masked"] = "*" * len(password) if password else ""
+    payload["personas"] = personas
+    payload["interfaces"] = interfaces
+    payload["system_info"] = {"ip_address": ip_address, "timestamp": now_iso(" ")}
+    # The timestamp changes every second; leave it out of the ETag so idle polls get 304s
+    etag_payload = dict(payload, system_info={"ip_address": ip_address})
+    response = _conditional_json(payload, etag_payload=etag_payload)
+    with _state_lock:
+        _status_fast["key"] = key
+        _status_fast["etag"] = response.get_etag()[0]
+        _status_fast["ts"] = now
+    return response
 
 
 @app.route("/api/personas", methods=["GET"])
 def api_list_personas():
     """List all persona containers"""
-    try:
-        if not initialize_managers():
-            return jsonify({
-                "success": False, 
-                "error": "Docker not available. Check container logs: docker logs wifi-manager"
-            }), 500
-        personas = persona_manager.list_personas()
-        return jsonify({"success": True, "personas": personas})
-    except Exception as e:
-        logger.exception(f"Error listing personas: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    if not initialize_managers():
+        return jsonify({
+            "success": False, 
+            "error": "Docker not available. Check container logs: docker logs wifi-manager"
+        }), 500
+    personas = _list_personas_coalesced()
+    return jsonify({"success": True, "personas": personas})
 
 
 @app.route("/api/personas", methods=["POST"])
 def api_start_persona():
     """Start a new persona container"""
-    try:
-        if not persona_manager:
-            return jsonify({"success": False, "error": "PersonaManager not initialized"}), 500
-            
-        data = request.get_json()
-        persona_type = data.get("persona_type")
-        interface = data.get("interface")
-        ssid = data.get("ssid")
-        password = data.get("password")
-        roaming_enabled = bool(data.get("roaming_enabled", False))
-        roaming_mode = (data.get("roaming_mode") or "best").strip().lower()
-        roam_interval_seconds = data.get("roam_interval_seconds")
-        roam_target_bssid = (data.get("roam_target_bssid") or "").strip()
+    if not persona_manager:
+        return jsonify({"success": False, "error": "PersonaManager not initialized"}), 500
         
-        if not persona_type or not interface:
-            return jsonify({"success": False, "error": "persona_type and interface required"}), 400
-        if roaming_mode not in {"best", "random", "target"}:
-            return jsonify({"success": False, "error": "roaming_mode must be one of: best, random, target"}), 400
-        
-        # Use config SSID/password if not provided
+    data = request.get_json()
+    persona_type = data.get("persona_type")
+    interface = data.get("interface")
+    ssid = data.get("ssid")
+    password = data.get("password")
+    roaming_enabled = bool(data.get("roaming_enabled", False))
+    roaming_mode = (data.get("roaming_mode") or "best").strip().lower()
+    roam_interval_seconds = data.get("roam_interval_seconds")
+    roam_target_bssid = (data.get("roam_target_bssid") or "").strip()
+    
+    if not persona_type or not interface:
+        return jsonify({"success": False, "error": "persona_type and interface required"}), 400
+    if roaming_mode not in {"best", "random", "target"}:
+        return jsonify({"success": False, "error": "roaming_mode must be one of: best, random, target"}), 400
+    
+    # Use config SSID/password if not provided
+    if not ssid or not password:
+        ssid, password = read_config()
+    
+    start_kwargs = {}
+
+    # For wired personas, no Wi-Fi config needed
+    if persona_type == 'wired':
+        ssid = None
+        password = None
+    # For bad personas, only SSID is needed (they use wrong password)
+    elif persona_type == 'bad':
+        if not ssid:
+            return jsonify({"success": False, "error": "SSID required for bad persona"}), 400
+        password = None  # Bad personas don't use the correct password
+    # For good personas, both are required and roaming is optional
+    elif persona_type == 'good':
         if not ssid or not password:
-            ssid, password = read_config()
-        
-        start_kwargs = {}
-
-        # For wired personas, no Wi-Fi config needed
-        if persona_type == 'wired':
-            ssid = None
-            password = None
-        # For bad personas, only SSID is needed (they use wrong password)
-        elif persona_type == 'bad':
-            if not ssid:
-                return jsonify({"success": False, "error": "SSID required for bad persona"}), 400
-            password = None  # Bad personas don't use the correct password
-        # For good personas, both are required and roaming is optional
-        elif persona_type == 'good':
-            if not ssid or not password:
-                return jsonify({"success": False, "error": "SSID and password required for good persona"}), 400
-            start_kwargs["roaming_enabled"] = roaming_enabled
-            start_kwargs["roaming_profile"] = "standard"
-            if roaming_enabled:
-                start_kwargs["roam_force_any_alternate"] = True
-                start_kwargs["roaming_selection_mode"] = roaming_mode
-                if roam_interval_seconds is not None and str(roam_interval_seconds).strip() != "":
-                    try:
-                        interval_value = int(roam_interval_seconds)
-                        if interval_value < 15 or interval_value > 3600:
-                            return jsonify({"success": False, "error": "roam_interval_seconds must be between 15 and 3600"}), 400
-                        start_kwargs["roam_interval_seconds"] = interval_value
-                    except ValueError:
-                        return jsonify({"success": False, "error": "roam_interval_seconds must be an integer"}), 400
-                if roaming_mode == "target":
-                    if not roam_target_bssid:
-                        return jsonify({"success": False, "error": "roam_target_bssid required when roaming_mode=target"}), 400
-                    if not re.match(r"^[0-9a-fA-F]{2}(:[0-9a-fA-F]{2}){5}$", roam_target_bssid):
-                        return jsonify({"success": False, "error": "roam_target_bssid must be a valid MAC (aa:bb:cc:dd:ee:ff)"}), 400
-                    start_kwargs["roam_target_bssid"] = roam_target_bssid
-        # Dedicated roaming persona uses aggressive roaming behavior
-        elif persona_type == 'roamer':
-            if not ssid or not password:
-                return jsonify({"success": False, "error": "SSID and password required for roamer persona"}), 400
-            start_kwargs["roaming_enabled"] = True
-            start_kwargs["roaming_profile"] = "aggressive"
+            return jsonify({"success": False, "error": "SSID and password required for good persona"}), 400
+        start_kwargs["roaming_enabled"] = roaming_enabled
+        start_kwargs["roaming_profile"] = "standard"
+        if roaming_enabled:
             start_kwargs["roam_force_any_alternate"] = True
             start_kwargs["roaming_selection_mode"] = roaming_mode
             if roam_interval_seconds is not None and str(roam_interval_seconds).strip() != "":
@@ -346,217 +774,221 @@ def api_start_persona():
                 if not re.match(r"^[0-9a-fA-F]{2}(:[0-9a-fA-F]{2}){5}$", roam_target_bssid):
                     return jsonify({"success": False, "error": "roam_target_bssid must be a valid MAC (aa:bb:cc:dd:ee:ff)"}), 400
                 start_kwargs["roam_target_bssid"] = roam_target_bssid
-        else:
-            return jsonify({"success": False, "error": f"Unsupported persona type: {persona_type}"}), 400
-        
-        success, message, container_id = persona_manager.start_persona(
-            persona_type=persona_type,
-            interface=interface,
-            ssid=ssid,
-            password=password,
-            **start_kwargs
-        )
-        
-        if success:
-            return jsonify({
-                "success": True,
-                "message": message,
-                "container_id": container_id
-            })
-        else:
-            return jsonify({"success": False, "error": message}), 500
-            
-    except Exception as e:
-        logger.error(f"Error starting persona: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    # Dedicated roaming persona uses aggressive roaming behavior
+    elif persona_type == 'roamer':
+        if not ssid or not password:
+            return jsonify({"success": False, "error": "SSID and password required for roamer persona"}), 400
+        start_kwargs["roaming_enabled"] = True
+        start_kwargs["roaming_profile"] = "aggressive"
+        start_kwargs["roam_force_any_alternate"] = True
+        start_kwargs["roaming_selection_mode"] = roaming_mode
+        if roam_interval_seconds is not None and str(roam_interval_seconds).strip() != "":
+            try:
+                interval_value = int(roam_interval_seconds)
+                if interval_value < 15 or interval_value > 3600:
+                    return jsonify({"success": False, "error": "roam_interval_seconds must be between 15 and 3600"}), 400
+                start_kwargs["roam_interval_seconds"] = interval_value
+            except ValueError:
+                return jsonify({"success": False, "error": "roam_interval_seconds must be an integer"}), 400
+        if roaming_mode == "target":
+            if not roam_target_bssid:
+                return jsonify({"success": False, "error": "roam_target_bssid required when roaming_mode=target"}), 400
+            if not re.match(r"^[0-9a-fA-F]{2}(:[0-9a-fA-F]{2}){5}$", roam_target_bssid):
+                return jsonify({"success": False, "error": "roam_target_bssid must be a valid MAC (aa:bb:cc:dd:ee:ff)"}), 400
+            start_kwargs["roam_target_bssid"] = roam_target_bssid
+    else:
+        return jsonify({"success": False, "error": f"Unsupported persona type: {persona_type}"}), 400
+    
+    success, message, container_id = persona_manager.start_persona(
+        persona_type=persona_type,
+        interface=interface,
+        ssid=ssid,
+        password=password,
+        **start_kwargs
+    )
+    _invalidate_interfaces_cache()
+    _invalidate_personas_cache()
+    
+    if success:
+        return jsonify({
+            "success": True,
+            "message": message,
+            "container_id": container_id
+        })
+    else:
+        return jsonify({"success": False, "error": message}), 500
 
 
 @app.route("/api/personas/<container_id>", methods=["DELETE"])
 def api_stop_persona(container_id):
     """Stop a persona container"""
-    try:
-        if not persona_manager:
-            return jsonify({"success": False, "error": "PersonaManager not initialized"}), 500
-        success, message = persona_manager.stop_persona(container_id=container_id)
-        
-        if success:
-            return jsonify({"success": True, "message": message})
-        else:
-            return jsonify({"success": False, "error": message}), 500
-            
-    except Exception as e:
-        logger.error(f"Error stopping persona: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    if not persona_manager:
+        return jsonify({"success": False, "error": "PersonaManager not initialized"}), 500
+    success, message = persona_manager.stop_persona(container_id=container_id)
+    _invalidate_interfaces_cache()
+    _invalidate_personas_cache()
+    
+    if success:
+        return jsonify({"success": True, "message": message})
+    else:
+        return jsonify({"success": False, "error": message}), 500
 
 
 @app.route("/api/personas/<container_id>/logs")
 def api_persona_logs(container_id):
     """Get logs from a persona container"""
-    try:
-        if not persona_manager:
-            return jsonify({"success": False, "error": "PersonaManager not initialized"}), 500
-        tail = int(request.args.get("tail", 100))
-        logs = persona_manager.get_persona_logs(container_id, tail=tail)
-        return jsonify({"success": True, "logs": logs})
-    except Exception as e:
-        logger.exception(f"Error getting logs: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    if not persona_manager:
+        return jsonify({"success": False, "error": "PersonaManager not initialized"}), 500
+    tail = int(request.args.get("tail", 100))
+    # A negative tail means "all" to Docker; cap it like any other oversized request
+    if tail < 0 or tail > _MAX_LOG_TAIL:
+        tail = _MAX_LOG_TAIL
+    logs = persona_manager.get_persona_logs(container_id, tail=tail)
+    return jsonify({"success": True, "logs": logs})
 
 
 @app.route("/api/logs/manager")
 def api_manager_logs():
     """Get logs from the manager container"""
-    try:
-        tail = int(request.args.get("tail", 500))
-        log_file = os.path.join(LOG_DIR, "manager.log")
-        
-        if not os.path.exists(log_file):
-            return jsonify({"success": True, "logs": ["Log file not found"]})
-        
-        # Read last N lines from log file
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-            logs = [line.rstrip() for line in lines[-tail:]]
-        
-        return jsonify({"success": True, "logs": logs})
-    except Exception as e:
-        logger.exception(f"Error getting manager logs: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    tail = min(int(request.args.get("tail", 500)), _MAX_LOG_TAIL)
+    log_file = os.path.join(LOG_DIR, "manager.log")
+    # Push queued and buffered records to disk so the tail includes recent activity;
+    # if the listener is backed up past the timeout the tail is best-effort
+    _flush_file_log()
+    
+    if not os.path.exists(log_file):
+        return jsonify({"success": True, "logs": ["Log file not found"]})
+    
+    # Read last N lines from log file
+    logs = _tail_lines(log_file, tail)
+    
+    return jsonify({"success": True, "logs": logs})
 
 
 @app.route("/api/logs/aggregate")
 def api_aggregate_logs():
-    """Get aggregated logs from all persona containers"""
-    try:
-        if not persona_manager:
-            return jsonify({"success": False, "error": "PersonaManager not initialized"}), 500
-        personas = persona_manager.list_personas()
-        aggregated = {}
-        
-        for persona in personas:
-            if persona.get('status') == 'running':
+    """
+    Get aggregated logs from all persona containers.
+    Streams each container's entry as soon as its fetch completes; ?format=ndjson
+    emits one {"id": ..., ...} object per line instead of a single JSON document.
+    """
+    if not persona_manager:
+        return jsonify({"success": False, "error": "PersonaManager not initialized"}), 500
+    ndjson = request.args.get("format") == "ndjson"
+    personas = _list_personas_coalesced()
+    
+    # Fetch logs concurrently so latency is bounded by the slowest container, not the sum
+    futures = {
+        _log_pool.submit(persona_manager.get_persona_logs, persona['id'], tail=50): persona
+        for persona in personas
+        if persona.get('status') == 'running'
+    }
+
+    def generate():
+        if not ndjson:
+            yield '{"success":true,"aggregated":{'
+        first = True
+        try:
+            for future in as_completed(futures, timeout=10):
+                persona = futures[future]
                 try:
-                    logs = persona_manager.get_persona_logs(persona['id'], tail=50)
-                    aggregated[persona['id']] = {
-                        'name': persona['name'],
-                        'type': persona.get('persona_type', 'unknown'),
-                        'interface': persona.get('interface', 'unknown'),
-                        'logs': logs
-                    }
+                    logs = future.result()
                 except Exception as e:
                     logger.warning(f"Failed to get logs for {persona['id']}: {e}")
-        
-        return jsonify({"success": True, "aggregated": aggregated})
-    except Exception as e:
-        logger.exception(f"Error aggregating logs: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+                    continue
+                entry = {
+                    'name': persona['name'],
+                    'type': persona.get('persona_type', 'unknown'),
+                    'interface': persona.get('interface', 'unknown'),
+                    'logs': logs
+                }
+                if ndjson:
+                    yield f"{app.json.dumps({'id': persona['id'], **entry})}\n"
+                else:
+                    yield f"{'' if first else ','}{app.json.dumps(persona['id'])}:{app.json.dumps(entry)}"
+                first = False
+        except FuturesTimeoutError:
+            pending = sum(1 for future in futures if not future.done())
+            logger.warning(f"Timed out waiting for logs from {pending} container(s)")
+        if not ndjson:
+            yield '}}\n'
+
+    mimetype = "application/x-ndjson" if ndjson else app.json.mimetype
+    return app.response_class(generate(), mimetype=mimetype)
 
 
 @app.route("/api/interfaces")
 def api_interfaces():
     """Get available network interfaces"""
-    try:
-        # Determine host management interface (default route) to protect it from assignment.
-        protected_iface = None
-        try:
-            import subprocess
-            route_result = subprocess.run(
-                ['ip', 'route', 'show', 'default'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            for line in route_result.stdout.split('\n'):
-                parts = line.split()
-                if 'dev' in parts:
-                    idx = parts.index('dev')
-                    if idx + 1 < len(parts):
-                        protected_iface = parts[idx + 1].strip()
-                        break
-        except Exception as e:
-            logger.debug(f"Could not determine protected interface: {e}")
+    # Determine host management interface (default route) to protect it from assignment.
+    protected_iface = _get_protected_iface()
 
-        # Try to initialize, but interfaces can work without Docker
-        if interface_manager is None:
-            initialize_managers()
-        
-        if not interface_manager:
-            # Fallback: use basic system commands
-            import subprocess
-            result = subprocess.run(['ip', 'link', 'show'], capture_output=True, text=True, timeout=5)
-            interfaces = {}
-            for line in result.stdout.split('\n'):
-                if ':' in line and ('wlan' in line or 'eth' in line):
-                    parts = line.split(':')
-                    if len(parts) >= 2:
-                        iface = parts[1].strip()
-                        # Get interface state
-                        state = 'DOWN'
-                        if 'state UP' in line or 'UP' in line:
-                            state = 'UP'
-                        interfaces[iface] = {
-                            'name': iface, 
-                            'type': 'wifi' if iface.startswith('wl') else 'ethernet',
-                            'state': state,
-                            'available': True,
-                            'assignable': True
-                        }
-                        if protected_iface and iface == protected_iface:
-                            interfaces[iface]['available'] = False
-                            interfaces[iface]['assignable'] = False
-                            interfaces[iface]['protected'] = True
-                            interfaces[iface]['reason'] = 'Management/default-route interface'
-            return jsonify({"success": True, "interfaces": interfaces, "note": "Basic mode - Docker unavailable"})
-        
-        interfaces = interface_manager.list_available_interfaces(include_ethernet=True)
-        # Merge in diagnostics-discovered Wi-Fi interfaces if the runtime scanner missed them.
-        # This helps when drivers expose interfaces inconsistently during initialization.
-        try:
-            diagnostics = run_diagnostics()
-            for wifi_iface in diagnostics.get("wifi_interfaces", []):
-                if wifi_iface == "wlan_sim":
-                    continue
-                if wifi_iface not in interfaces:
-                    interfaces[wifi_iface] = {
-                        "name": wifi_iface,
-                        "type": "wifi",
-                        "state": "unknown",
-                        "available": True,
-                        "assignable": True,
-                        "detected_via": "diagnostics",
-                    }
-        except Exception as e:
-            logger.debug(f"Diagnostics merge for interfaces failed: {e}")
-        # Ensure all interfaces have required fields for display
-        for iface_name, iface_info in interfaces.items():
-            if 'state' not in iface_info:
-                iface_info['state'] = 'unknown'
-            if 'type' not in iface_info:
-                iface_info['type'] = 'wifi' if iface_name.startswith('wl') else 'ethernet'
-            if 'assignable' not in iface_info:
-                iface_info['assignable'] = True
-            # Mark management/default-route interface as protected.
-            if protected_iface and iface_name == protected_iface:
-                iface_info['available'] = False
-                iface_info['assignable'] = False
-                iface_info['protected'] = True
-                iface_info['reason'] = 'Management/default-route interface'
-        
-        return jsonify({"success": True, "interfaces": interfaces})
+    # Try to initialize, but interfaces can work without Docker
+    if interface_manager is None:
+        initialize_managers()
+    
+    if not interface_manager:
+        # Fallback: read link state straight from the kernel via psutil
+        interfaces = {}
+        for iface, stats in psutil.net_if_stats().items():
+            if not iface.startswith(('wlan', 'eth')):
+                continue
+            interfaces[iface] = {
+                'name': iface,
+                'type': 'wifi' if iface.startswith('wl') else 'ethernet',
+                'state': 'UP' if stats.isup else 'DOWN',
+                'available': True,
+                'assignable': True
+            }
+            if protected_iface and iface == protected_iface:
+                interfaces[iface]['available'] = False
+                interfaces[iface]['assignable'] = False
+                interfaces[iface]['protected'] = True
+                interfaces[iface]['reason'] = 'Management/default-route interface'
+        return _conditional_json({"success": True, "interfaces": interfaces, "note": "Basic mode - Docker unavailable"})
+    
+    interfaces = _list_interfaces_cached()
+    # Merge in diagnostics-discovered Wi-Fi interfaces if the runtime scanner missed them.
+    # This helps when drivers expose interfaces inconsistently during initialization.
+    try:
+        diagnostics = run_diagnostics()
+        for wifi_iface in diagnostics.get("wifi_interfaces", []):
+            if wifi_iface == "wlan_sim":
+                continue
+            if wifi_iface not in interfaces:
+                interfaces[wifi_iface] = {
+                    "name": wifi_iface,
+                    "type": "wifi",
+                    "state": "unknown",
+                    "available": True,
+                    "assignable": True,
+                    "detected_via": "diagnostics",
+                }
     except Exception as e:
-        logger.exception(f"Error getting interfaces: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        logger.debug(f"Diagnostics merge for interfaces failed: {e}")
+    # Ensure all interfaces have required fields for display
+    for iface_name, iface_info in interfaces.items():
+        if 'state' not in iface_info:
+            iface_info['state'] = 'unknown'
+        if 'type' not in iface_info:
+            iface_info['type'] = 'wifi' if iface_name.startswith('wl') else 'ethernet'
+        if 'assignable' not in iface_info:
+            iface_info['assignable'] = True
+        # Mark management/default-route interface as protected.
+        if protected_iface and iface_name == protected_iface:
+            iface_info['available'] = False
+            iface_info['assignable'] = False
+            iface_info['protected'] = True
+            iface_info['reason'] = 'Management/default-route interface'
+    
+    return _conditional_json({"success": True, "interfaces": interfaces})
 
 
 @app.route("/api/diagnostics")
 def api_diagnostics():
     """Get driver and interface diagnostics"""
-    try:
-        diagnostics = run_diagnostics()
-        return jsonify({"success": True, "diagnostics": diagnostics})
-    except Exception as e:
-        logger.exception(f"Error running diagnostics: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    diagnostics = run_diagnostics()
+    return jsonify({"success": True, "diagnostics": diagnostics})
 
 
 @app.route("/update_wifi", methods=["POST"])
@@ -572,6 +1004,7 @@ def update_wifi():
 
         if write_config(new_ssid, new_password):
             logger.info(f"Wi-Fi config updated: SSID={new_ssid}")
+            _regenerate_index()
             flash("Wi-Fi configuration updated successfully", "success")
         else:
             flash("Failed to update configuration", "error")
@@ -586,19 +1019,17 @@ def update_wifi():
 @app.route("/shutdown", methods=["POST"])
 def shutdown():
     """Graceful shutdown - stop all personas"""
-    try:
-        if not persona_manager:
-            return jsonify({"success": False, "error": "PersonaManager not initialized"}), 500
-        logger.info("Shutdown requested - stopping all personas")
-        results = persona_manager.cleanup_all()
-        return jsonify({
-            "success": True,
-            "message": "All personas stopped",
-            "results": results
-        })
-    except Exception as e:
-        logger.exception(f"Error during shutdown: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    if not persona_manager:
+        return jsonify({"success": False, "error": "PersonaManager not initialized"}), 500
+    logger.info("Shutdown requested - stopping all personas")
+    results = persona_manager.cleanup_all()
+    _invalidate_interfaces_cache()
+    _invalidate_personas_cache()
+    return jsonify({
+        "success": True,
+        "message": "All personas stopped",
+        "results": results
+    })
 
 
 # Error handler for debugging
@@ -609,50 +1040,79 @@ def internal_error(error):
 
 @app.errorhandler(Exception)
 def handle_exception(e):
-    logger.exception(f"Unhandled exception: {e}")
+    """Single JSON error wrapper for API routes (they no longer carry their own try/except)"""
+    if isinstance(e, HTTPException):
+        # Keep 4xx/405 semantics (e.g. missing static files) instead of reporting a 500,
+        # along with their headers (Allow on 405)
+        resp = jsonify({"success": False, "error": e.description})
+        resp.status_code = e.code
+        resp.headers.extend(h for h in e.get_headers() if h[0].lower() != 'content-type')
+        return resp
+    logger.exception(f"Unhandled exception in {request.path}: {e}")
     return jsonify({"success": False, "error": str(e)}), 500
 
+# /debug results are cached briefly; the Docker ping reuses one client instead of a new handshake
+_DEBUG_CACHE_TTL = 2.0
+_debug_lock = threading.Lock()
+_debug_cache = {
+    "ts": 0.0,
+    "value": None,
+    "docker_client": None,
+}
+
+
+def _collect_debug_info():
+    """Gather application/Docker state for /debug"""
+    # Check Docker socket
+    docker_sock_accessible = False
+    docker_sock_perms = "N/A"
+    docker_error = None
+    try:
+        if os.path.exists("/var/run/docker.sock"):
+            docker_sock_perms = oct(os.stat("/var/run/docker.sock").st_mode)[-3:]
+            # Try to connect
+            if _debug_cache["docker_client"] is None:
+                _debug_cache["docker_client"] = docker.from_env()
+            _debug_cache["docker_client"].ping()
+            docker_sock_accessible = True
+    except Exception as e:
+        docker_error = str(e)
+        _debug_cache["docker_client"] = None
+    
+    return {
+        "base_dir": BASE_DIR,
+        "template_dir": template_dir,
+        "static_dir": static_dir,
+        "template_exists": os.path.exists(template_dir),
+        "static_exists": os.path.exists(static_dir),
+        "template_files": _template_files,
+        "static_files": _static_files,
+        "persona_manager_initialized": persona_manager is not None,
+        "interface_manager_initialized": interface_manager is not None,
+        "config_file_exists": os.path.exists(CONFIG_FILE),
+        "log_dir_exists": os.path.exists(LOG_DIR),
+        "docker_sock_exists": os.path.exists("/var/run/docker.sock"),
+        "docker_sock_permissions": docker_sock_perms,
+        "docker_sock_accessible": docker_sock_accessible,
+        "docker_error": docker_error,
+        "current_user": os.getuid(),
+        "current_gid": os.getgid(),
+    }
+
+
 @app.route("/debug")
 def debug_info():
     """Debug endpoint to check application state"""
-    try:
-        # Check Docker socket
-        docker_sock_accessible = False
-        docker_sock_perms = "N/A"
-        try:
-            if os.path.exists("/var/run/docker.sock"):
-                docker_sock_perms = oct(os.stat("/var/run/docker.sock").st_mode)[-3:]
-                # Try to connect
-                import docker
-                test_client = docker.from_env()
-                test_client.ping()
-                docker_sock_accessible = True
-        except Exception as e:
-            docker_error = str(e)
-        
-        info = {
-            "base_dir": BASE_DIR,
-            "template_dir": template_dir,
-            "static_dir": static_dir,
-            "template_exists": os.path.exists(template_dir),
-            "static_exists": os.path.exists(static_dir),
-            "template_files": os.listdir(template_dir) if os.path.exists(template_dir) else [],
-            "static_files": os.listdir(static_dir) if os.path.exists(static_dir) else [],
-            "persona_manager_initialized": persona_manager is not None,
-            "interface_manager_initialized": interface_manager is not None,
-            "config_file_exists": os.path.exists(CONFIG_FILE),
-            "log_dir_exists": os.path.exists(LOG_DIR),
-            "docker_sock_exists": os.path.exists("/var/run/docker.sock"),
-            "docker_sock_permissions": docker_sock_perms,
-            "docker_sock_accessible": docker_sock_accessible,
-            "docker_error": docker_error if 'docker_error' in locals() else None,
-            "current_user": os.getuid(),
-            "current_gid": os.getgid(),
-        }
-        return jsonify(info)
-    except Exception as e:
-        return jsonify({"error": str(e), "traceback": traceback.format_exc()}), 500
+    now = time.monotonic()
+    with _debug_lock:
+        if _debug_cache["value"] is None or now - _debug_cache["ts"] >= _DEBUG_CACHE_TTL:
+            _debug_cache["value"] = _collect_debug_info()
+            _debug_cache["ts"] = now
+        info = _debug_cache["value"]
+    return jsonify(info)
 
+# Production entry point is gunicorn (see Dockerfile.manager: manager.app:app);
+# running this module directly uses the Werkzeug development server.
 if __name__ == "__main__":
     logger.info(f"Wi-Fi Dashboard Manager v{VERSION} starting")
     logger.info(f"BASE_DIR: {BASE_DIR}")
@@ -660,4 +1120,4 @@ if __name__ == "__main__":
     logger.info(f"Static dir: {static_dir}")
     logger.info(f"Templates exist: {os.path.exists(template_dir)}")
     logger.info(f"Static exists: {os.path.exists(static_dir)}")
-    app.run(host="0.0.0.0", port=5000, debug=False)
+    app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)
@@ -3,44 +3,116 @@ Driver Diagnostics: Detects USB Wi-Fi devices and checks if drivers are loaded.
 Provides recommendations for missing drivers.
 """
 
+import os
+import json
 import subprocess
 import logging
 import re
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# lsusb line: "Bus 001 Device 003: ID 7392:b811 ..."; lsusb -t line: "... Driver=rtl8xxxu, 480M"
+# The name group is everything after "Device NNN:", matching the sysfs-derived names
+_LSUSB_LINE_RE = re.compile(r'Bus \d+ Device \d+: (ID ([0-9a-f]{4}):([0-9a-f]{4}).*)')
+_DRIVER_RE = re.compile(r'Driver=([^,\s/]+)')
+# lsusb -tv prints the node's "ID vvvv:pppp ..." on the line after each "Driver=" line
+_TREE_ID_RE = re.compile(r'\s*ID ([0-9a-f]{4}:[0-9a-f]{4})')
+# Common Wi-Fi driver name fragments, matched anywhere in a module name in one pass
+_WIFI_MODULE_RE = re.compile(
+    r'rtl|ath|iwl|brcm|mt76|mt792|rt28|rt2x00|wl|b43|zd1211|hostap|mac80211|cfg80211',
+    re.IGNORECASE
+)
+
+WifiDevice = namedtuple('WifiDevice', 'driver alt_driver name')
+
 # Common USB Wi-Fi device IDs and their required drivers
-# Format: 'vendor:product' -> {'driver': 'module_name', 'alt_driver': 'alternative', 'name': 'Display Name'}
+# Format: 'vendor:product' -> WifiDevice(driver='module_name', alt_driver='alternative' or None, name='Display Name')
 USB_WIFI_DRIVERS = {
     # Realtek - Most common
-    '7392:b811': {'driver': 'rtl8xxxu', 'alt_driver': 'rtl8192cu', 'name': 'Realtek RTL8188EU (Edimax N150)'},
-    '0bda:8176': {'driver': 'rtl8192cu', 'name': 'Realtek RTL8192CU'},
-    '0bda:8178': {'driver': 'rtl8192cu', 'name': 'Realtek RTL8192CU'},
-    '0bda:8179': {'driver': 'rtl8192cu', 'name': 'Realtek RTL8192CU'},
-    '0bda:818b': {'driver': 'rtl8192cu', 'name': 'Realtek RTL8192CU'},
-    '0bda:8187': {'driver': 'rtl8192cu', 'name': 'Realtek RTL8192CU'},
-    '0bda:8812': {'driver': 'rtl8812au', 'name': 'Realtek RTL8812AU'},
-    '0bda:8813': {'driver': 'rtl8812au', 'name': 'Realtek RTL8812AU'},
-    '0bda:8821': {'driver': 'rtl8821au', 'name': 'Realtek RTL8821AU'},
-    '0bda:0821': {'driver': 'rtl8xxxu', 'name': 'Realtek RTL8821AU'},
-    '0bda:0823': {'driver': 'rtl8xxxu', 'name': 'Realtek RTL8822BU'},
+    '7392:b811': WifiDevice('rtl8xxxu', 'rtl8192cu', 'Realtek RTL8188EU (Edimax N150)'),
+    '0bda:8176': WifiDevice('rtl8192cu', None, 'Realtek RTL8192CU'),
+    '0bda:8178': WifiDevice('rtl8192cu', None, 'Realtek RTL8192CU'),
+    '0bda:8179': WifiDevice('rtl8192cu', None, 'Realtek RTL8192CU'),
+    '0bda:818b': WifiDevice('rtl8192cu', None, 'Realtek RTL8192CU'),
+    '0bda:8187': WifiDevice('rtl8192cu', None, 'Realtek RTL8192CU'),
+    '0bda:8812': WifiDevice('rtl8812au', None, 'Realtek RTL8812AU'),
+    '0bda:8813': WifiDevice('rtl8812au', None, 'Realtek RTL8812AU'),
+    '0bda:8821': WifiDevice('rtl8821au', None, 'Realtek RTL8821AU'),
+    '0bda:0821': WifiDevice('rtl8xxxu', None, 'Realtek RTL8821AU'),
+    '0bda:0823': WifiDevice('rtl8xxxu', None, 'Realtek RTL8822BU'),
     # Ralink/MediaTek
-    '148f:5370': {'driver': 'rt2800usb', 'name': 'Ralink RT5370'},
-    '148f:5572': {'driver': 'rt2800usb', 'name': 'Ralink RT5572'},
-    '148f:7601': {'driver': 'mt7601u', 'name': 'MediaTek MT7601U'},
+    '148f:5370': WifiDevice('rt2800usb', None, 'Ralink RT5370'),
+    '148f:5572': WifiDevice('rt2800usb', None, 'Ralink RT5572'),
+    '148f:7601': WifiDevice('mt7601u', None, 'MediaTek MT7601U'),
     # Atheros
-    '0cf3:9271': {'driver': 'ath9k_htc', 'name': 'Atheros AR9271'},
-    '0cf3:7015': {'driver': 'ath9k_htc', 'name': 'Atheros AR7015'},
+    '0cf3:9271': WifiDevice('ath9k_htc', None, 'Atheros AR9271'),
+    '0cf3:7015': WifiDevice('ath9k_htc', None, 'Atheros AR7015'),
     # Broadcom
-    '0a5c:bd27': {'driver': 'brcmfmac', 'name': 'Broadcom BCM43236'},
+    '0a5c:bd27': WifiDevice('brcmfmac', None, 'Broadcom BCM43236'),
     # Intel
-    '8086:08b1': {'driver': 'iwlwifi', 'name': 'Intel Wireless'},
-    '8086:08b2': {'driver': 'iwlwifi', 'name': 'Intel Wireless'},
+    '8086:08b1': WifiDevice('iwlwifi', None, 'Intel Wireless'),
+    '8086:08b2': WifiDevice('iwlwifi', None, 'Intel Wireless'),
 }
 
 
+USB_SYSFS_DIR = '/sys/bus/usb/devices'
+
+
+def _read_sysfs(path: str) -> str:
+    """Read a sysfs attribute, returning '' if it is absent"""
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return ''
+
+
 def get_usb_devices() -> List[Dict]:
+    """Get list of USB devices from sysfs (falls back to lsusb when sysfs is unavailable)"""
+    devices = []
+    try:
+        entries = sorted(os.scandir(USB_SYSFS_DIR), key=lambda e: e.name)
+    except FileNotFoundError:
+        return _get_usb_devices_lsusb()
+    except Exception as e:
+        logger.error(f"Error getting USB devices: {e}")
+        return devices
+    
+    for entry in entries:
+        # Skip interface nodes ("1-1.2:1.0"); devices are "usbN" root hubs and "B-P[.P...]"
+        if ':' in entry.name:
+            continue
+        base = entry.path
+        vendor_id = _read_sysfs(os.path.join(base, 'idVendor'))
+        product_id = _read_sysfs(os.path.join(base, 'idProduct'))
+        if not vendor_id or not product_id:
+            continue
+        device_id = f"{vendor_id}:{product_id}"
+        description = ' '.join(filter(None, (
+            _read_sysfs(os.path.join(base, 'manufacturer')),
+            _read_sysfs(os.path.join(base, 'product')),
+        )))
+        busnum = _read_sysfs(os.path.join(base, 'busnum')) or '0'
+        devnum = _read_sysfs(os.path.join(base, 'devnum')) or '0'
+        # Same shape as an lsusb line so the UI and name derivation are unchanged
+        line = f"Bus {int(busnum):03d} Device {int(devnum):03d}: ID {device_id} {description}".rstrip()
+        devices.append({
+            'id': device_id,
+            'vendor_id': vendor_id,
+            'product_id': product_id,
+            'name': line.split(':', 1)[1].strip(),
+            'full_line': line,
+            'bus_path': entry.name
+        })
+    
+    return devices
+
+
+def _get_usb_devices_lsusb() -> List[Dict]:
     """Get list of USB devices using lsusb"""
     devices = []
     try:
@@ -52,25 +124,17 @@ def get_usb_devices() -> List[Dict]:
         )
         
         for line in result.stdout.split('\n'):
-            if 'ID' in line:
-                # Parse: "Bus 001 Device 003: ID 7392:b811 Edimax Technology Co., Ltd Edimax N150 Adapter"
-                match = re.search(r'ID\s+([0-9a-f]{4}):([0-9a-f]{4})', line)
-                if match:
-                    vendor_id = match.group(1)
-                    product_id = match.group(2)
-                    device_id = f"{vendor_id}:{product_id}"
-                    
-                    # Extract device name
-                    parts = line.split(':', 1)
-                    name = parts[1].strip() if len(parts) > 1 else 'Unknown device'
-                    
-                    devices.append({
-                        'id': device_id,
-                        'vendor_id': vendor_id,
-                        'product_id': product_id,
-                        'name': name,
-                        'full_line': line
-                    })
+            # Parse: "Bus 001 Device 003: ID 7392:b811 Edimax Technology Co., Ltd Edimax N150 Adapter"
+            match = _LSUSB_LINE_RE.match(line)
+            if match:
+                name, vendor_id, product_id = match.groups()
+                devices.append({
+                    'id': f"{vendor_id}:{product_id}",
+                    'vendor_id': vendor_id,
+                    'product_id': product_id,
+                    'name': name.strip(),
+                    'full_line': line
+                })
     except Exception as e:
         logger.error(f"Error getting USB devices: {e}")
     
@@ -78,69 +142,107 @@ def get_usb_devices() -> List[Dict]:
 
 
 def get_loaded_drivers() -> List[str]:
-    """Get list of loaded Wi-Fi driver modules"""
+    """Get list of loaded Wi-Fi driver modules from /proc/modules"""
     drivers = []
+    seen = set()
     try:
-        result = subprocess.run(
-            ['lsmod'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        # Common Wi-Fi driver patterns
-        wifi_driver_patterns = [
-            'rtl', 'ath', 'iwl', 'brcm', 'mt76', 'mt792', 'rt28', 'rt2x00',
-            'wl', 'b43', 'b43legacy', 'zd1211', 'hostap', 'mac80211', 'cfg80211'
-        ]
+        with open('/proc/modules', 'r') as f:
+            lines = f.read().splitlines()
         
-        for line in result.stdout.split('\n'):
-            module_name = line.split()[0] if line.split() else ''
-            if any(pattern in module_name.lower() for pattern in wifi_driver_patterns):
-                if module_name not in drivers:
-                    drivers.append(module_name)
+        for line in lines:
+            # "<name> <size> <refcount> <deps> <state> <addr>"
+            module_name = line.split(' ', 1)[0]
+            if module_name not in seen and _WIFI_MODULE_RE.search(module_name):
+                seen.add(module_name)
+                drivers.append(module_name)
     except Exception as e:
         logger.error(f"Error getting loaded drivers: {e}")
     
     return drivers
 
 
-def check_driver_for_device(device_id: str) -> Optional[Dict]:
-    """Check if a driver is bound to a specific USB device"""
+def get_bound_driver(bus_path: str) -> Dict:
+    """Driver bound to a USB device's interfaces, read from its sysfs driver symlinks"""
+    prefix = f"{bus_path}:"
+    try:
+        for entry in os.scandir(USB_SYSFS_DIR):
+            if entry.name.startswith(prefix):
+                try:
+                    return {'driver': os.path.basename(os.readlink(os.path.join(entry.path, 'driver'))), 'bound': True}
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.debug(f"Error reading USB driver for {bus_path}: {e}")
+    return {'driver': None, 'bound': False}
+
+
+def get_usb_tree() -> str:
+    """Get the `lsusb -tv` topology text (empty string on failure)"""
     try:
         result = subprocess.run(
-            ['lsusb', '-t'],
+            ['lsusb', '-tv'],
             capture_output=True,
             text=True,
             timeout=5
         )
+        return result.stdout
+    except Exception as e:
+        logger.debug(f"Error getting USB tree: {e}")
+        return ''
+
+
+def parse_usb_tree(usb_tree: str) -> Dict[str, str]:
+    """Map 'vendor:product' -> first bound driver from `lsusb -tv` output"""
+    drivers = {}
+    node_driver = None
+    for line in usb_tree.splitlines():
+        driver_match = _DRIVER_RE.search(line)
+        if driver_match:
+            node_driver = driver_match.group(1)
+            continue
+        id_match = _TREE_ID_RE.match(line)
+        # Unbound interfaces show as Driver=(none) (older usbutils) or Driver=[none]
+        if id_match and node_driver and node_driver not in ('(none)', '[none]'):
+            drivers.setdefault(id_match.group(1), node_driver)
+        node_driver = None
+    return drivers
+
+
+def check_driver_for_device(device_id: str, tree_drivers: Optional[Dict[str, str]] = None) -> Optional[Dict]:
+    """
+    Check if a driver is bound to a specific USB device.
+    tree_drivers is a pre-parsed parse_usb_tree() map, so a caller checking many devices spawns
+    lsusb -tv once.
+    """
+    try:
+        if tree_drivers is None:
+            tree_drivers = parse_usb_tree(get_usb_tree())
         
-        # Look for the device in the tree and check Driver field
-        for line in result.stdout.split('\n'):
-            if device_id.split(':')[1] in line or device_id in line:
-                # Check if driver is mentioned
-                if 'Driver=' in line:
-                    driver_match = re.search(r'Driver=(\S+)', line)
-                    if driver_match:
-                        driver = driver_match.group(1)
-                        if driver and driver != '(none)':
-                            return {'driver': driver, 'bound': True}
+        driver = tree_drivers.get(device_id)
+        if driver:
+            return {'driver': driver, 'bound': True}
         
-        # Also try lsusb -v
-        result = subprocess.run(
+        # Also try lsusb -v; its output can be large, so read it as a stream and stop at the first bound driver
+        proc = subprocess.Popen(
             ['lsusb', '-v', '-d', device_id],
-            capture_output=True,
-            text=True,
-            timeout=5
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
         )
-        
-        # Check if driver is bound
-        if 'Driver=' in result.stdout:
-            for line in result.stdout.split('\n'):
+        watchdog = threading.Timer(5, proc.kill)
+        watchdog.start()
+        try:
+            for line in proc.stdout:
                 if 'Driver=' in line:
                     driver = line.split('Driver=')[1].strip()
                     if driver and driver != '(none)':
                         return {'driver': driver, 'bound': True}
+        finally:
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
         
         return {'driver': None, 'bound': False}
     except Exception as e:
@@ -177,8 +279,48 @@ def get_available_interfaces() -> List[str]:
     return sorted(interfaces)
 
 
+# modinfo hits persist across runs (and restarts) for the running kernel. Only "module exists"
+# is stored: a missing module may be installed later, which is what the diagnostics recommend.
+MODULE_CACHE_FILE = '/tmp/wifi_dashboard_diag_cache.json'
+_KERNEL_RELEASE = os.uname().release
+_module_cache_lock = threading.Lock()
+
+
+def _load_known_modules() -> set:
+    """Module names previously found by modinfo on this kernel"""
+    try:
+        with open(MODULE_CACHE_FILE, 'r') as f:
+            data = json.load(f)
+        if data.get('kernel') == _KERNEL_RELEASE:
+            return set(data.get('modules', []))
+    except (OSError, ValueError, AttributeError):
+        pass
+    return set()
+
+
+_known_modules = _load_known_modules()
+
+
+def _remember_module(driver_name: str):
+    """Record a module modinfo found and persist the set atomically"""
+    # Write under the lock too: threads share the per-process temp path, and the newest set
+    # must be the one that lands
+    with _module_cache_lock:
+        _known_modules.add(driver_name)
+        payload = {'kernel': _KERNEL_RELEASE, 'modules': sorted(_known_modules)}
+        try:
+            tmp_path = f"{MODULE_CACHE_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, MODULE_CACHE_FILE)
+        except OSError as e:
+            logger.debug(f"Could not write diagnostics cache: {e}")
+
+
 def check_driver_module_exists(driver_name: str) -> bool:
     """Check if a driver module exists (can be loaded)"""
+    if driver_name in _known_modules:
+        return True
     try:
         result = subprocess.run(
             ['modinfo', driver_name],
@@ -186,7 +328,10 @@ def check_driver_module_exists(driver_name: str) -> bool:
             text=True,
             timeout=3
         )
-        return result.returncode == 0
+        if result.returncode == 0:
+            _remember_module(driver_name)
+            return True
+        return False
     except Exception:
         return False
 
@@ -205,119 +350,141 @@ def run_diagnostics() -> Dict:
         'recommendations': []
     }
     
-    # Get USB devices
-    usb_devices = get_usb_devices()
+    # The three enumerations are independent; overlap them (iw dev and any lsusb fallback fork)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        usb_future = pool.submit(get_usb_devices)
+        drivers_future = pool.submit(get_loaded_drivers)
+        interfaces_future = pool.submit(get_available_interfaces)
+        usb_devices = usb_future.result()
+        loaded_drivers = drivers_future.result()
+        wifi_interfaces = interfaces_future.result()
     diagnostics['usb_devices'] = usb_devices
-    
-    # Get loaded drivers
-    loaded_drivers = get_loaded_drivers()
     diagnostics['loaded_drivers'] = loaded_drivers
-    
-    # Get available interfaces
-    wifi_interfaces = get_available_interfaces()
     diagnostics['wifi_interfaces'] = wifi_interfaces
     
-    # Analyze USB Wi-Fi devices
+    # Bound-driver lookups for known Wi-Fi devices are independent too; lsusb -tv (only needed
+    # for devices not enumerated via sysfs) is fetched and parsed once and shared
+    known_devices = [device for device in usb_devices if device['id'] in USB_WIFI_DRIVERS]
+    tree_drivers = None
+    if any(not device.get('bus_path') for device in known_devices):
+        tree_drivers = parse_usb_tree(get_usb_tree())
+    
+    def bound_driver(device: Dict) -> Optional[Dict]:
+        if device.get('bus_path'):
+            return get_bound_driver(device['bus_path'])
+        return check_driver_for_device(device['id'], tree_drivers)
+    
+    driver_infos = []
+    if known_devices:
+        with ThreadPoolExecutor(max_workers=min(8, len(known_devices))) as pool:
+            driver_infos = list(pool.map(bound_driver, known_devices))
+    
+    # modinfo answers are the same for every device; run each at most once
+    module_exists_cache = {}
+    
+    def module_exists(driver_name: str) -> bool:
+        if driver_name not in module_exists_cache:
+            module_exists_cache[driver_name] = check_driver_module_exists(driver_name)
+        return module_exists_cache[driver_name]
+    
+    # Analyze USB Wi-Fi devices (hot lookups bound to locals once, outside the loop)
     wifi_usb_devices = []
-    for device in usb_devices:
+    add_issue = diagnostics['issues'].append
+    add_recommendation = diagnostics['recommendations'].append
+    drivers_table = USB_WIFI_DRIVERS
+    # Approximate interface check: with N interfaces, assume the first N known devices have one
+    n_interfaces = len(wifi_interfaces)
+    for index, (device, driver_info) in enumerate(zip(known_devices, driver_infos)):
         device_id = device['id']
+        wifi_info = drivers_table[device_id]
         
-        # Check if it's a known Wi-Fi device
-        if device_id in USB_WIFI_DRIVERS:
-            wifi_info = USB_WIFI_DRIVERS[device_id]
-            driver_info = check_driver_for_device(device_id)
-            
-            expected_driver = wifi_info.get('driver')
-            alt_driver = wifi_info.get('alt_driver')
-            
-            device_status = {
-                'device': device,
-                'expected_driver': expected_driver,
-                'alt_driver': alt_driver,
-                'device_name': wifi_info.get('name', device['name']),
-                'driver_loaded': driver_info['bound'] if driver_info else False,
-                'driver_name': driver_info['driver'] if driver_info else None,
-                'has_interface': False
-            }
-            
-            # Check if interface exists (approximate - count interfaces)
-            # If we have more interfaces than devices analyzed, assume they're working
-            device_status['has_interface'] = len(wifi_interfaces) > len(wifi_usb_devices)
-            
-            wifi_usb_devices.append(device_status)
+        expected_driver = wifi_info.driver
+        alt_driver = wifi_info.alt_driver
+        
+        device_status = {
+            'device': device,
+            'expected_driver': expected_driver,
+            'alt_driver': alt_driver,
+            'device_name': wifi_info.name or device['name'],
+            'driver_loaded': driver_info['bound'] if driver_info else False,
+            'driver_name': driver_info['driver'] if driver_info else None,
+            'has_interface': index < n_interfaces
+        }
+        
+        wifi_usb_devices.append(device_status)
+        
+        # Check for issues
+        if not device_status['driver_loaded']:
+            # Check if driver module exists
+            driver_exists = expected_driver in loaded_drivers or (alt_driver and alt_driver in loaded_drivers)
+            driver_module_exists = module_exists(expected_driver) or (alt_driver and module_exists(alt_driver))
             
-            # Check for issues
-            if not device_status['driver_loaded']:
-                # Check if driver module exists
-                driver_exists = expected_driver in loaded_drivers or (alt_driver and alt_driver in loaded_drivers)
-                driver_module_exists = check_driver_module_exists(expected_driver) or (alt_driver and check_driver_module_exists(alt_driver))
+            if not driver_exists and driver_module_exists:
+                # Driver module exists but not loaded
+                add_issue({
+                    'type': 'driver_not_loaded',
+                    'severity': 'high',
+                    'device': device_status['device_name'],
+                    'device_id': device_id,
+                    'expected_driver': expected_driver,
+                    'alt_driver': alt_driver,
+                    'message': f"USB Wi-Fi device {device_status['device_name']} detected but driver not loaded"
+                })
+                
+                # Generate recommendation
+                drivers_to_try = [expected_driver]
+                if alt_driver:
+                    drivers_to_try.append(alt_driver)
                 
-                if not driver_exists and driver_module_exists:
-                    # Driver module exists but not loaded
-                    diagnostics['issues'].append({
-                        'type': 'driver_not_loaded',
-                        'severity': 'high',
-                        'device': device_status['device_name'],
-                        'device_id': device_id,
-                        'expected_driver': expected_driver,
-                        'alt_driver': alt_driver,
-                        'message': f"USB Wi-Fi device {device_status['device_name']} detected but driver not loaded"
-                    })
-                    
-                    # Generate recommendation
-                    drivers_to_try = [expected_driver]
-                    if alt_driver:
-                        drivers_to_try.append(alt_driver)
-                    
-                    diagnostics['recommendations'].append({
-                        'type': 'load_driver',
-                        'device': device_status['device_name'],
-                        'device_id': device_id,
-                        'commands': [f"sudo modprobe {driver}" for driver in drivers_to_try],
-                        'persistent': f"Add to /etc/modules: echo '{drivers_to_try[0]}' | sudo tee -a /etc/modules",
-                        'message': f"Load driver for {device_status['device_name']}: sudo modprobe {expected_driver}"
-                    })
-                elif not driver_module_exists:
-                    # Driver module doesn't exist - may need installation
-                    diagnostics['issues'].append({
-                        'type': 'driver_missing',
-                        'severity': 'high',
-                        'device': device_status['device_name'],
-                        'device_id': device_id,
-                        'expected_driver': expected_driver,
-                        'message': f"USB Wi-Fi device {device_status['device_name']} detected but driver module not found"
-                    })
-                    
-                    diagnostics['recommendations'].append({
-                        'type': 'install_driver',
-                        'device': device_status['device_name'],
-                        'device_id': device_id,
-                        'expected_driver': expected_driver,
-                        'message': f"Driver module {expected_driver} not found. May need to install firmware or compile driver.",
-                        'suggestions': [
-                            f"Check if firmware package exists: apt-cache search {expected_driver}",
-                            f"Install firmware: sudo apt-get install firmware-realtek",
-                            f"Or check kernel modules: find /lib/modules/$(uname -r) -name '*{expected_driver}*'"
-                        ]
-                    })
-                else:
-                    # Driver loaded but not bound
-                    diagnostics['issues'].append({
-                        'type': 'driver_not_bound',
-                        'severity': 'medium',
-                        'device': device_status['device_name'],
-                        'device_id': device_id,
-                        'message': f"Driver module loaded but not bound to device"
-                    })
-            elif not device_status['has_interface']:
-                # Driver loaded but no interface
-                diagnostics['issues'].append({
-                    'type': 'no_interface',
+                add_recommendation({
+                    'type': 'load_driver',
+                    'device': device_status['device_name'],
+                    'device_id': device_id,
+                    'commands': [f"sudo modprobe {driver}" for driver in drivers_to_try],
+                    'persistent': f"Add to /etc/modules: echo '{drivers_to_try[0]}' | sudo tee -a /etc/modules",
+                    'message': f"Load driver for {device_status['device_name']}: sudo modprobe {expected_driver}"
+                })
+            elif not driver_module_exists:
+                # Driver module doesn't exist - may need installation
+                add_issue({
+                    'type': 'driver_missing',
+                    'severity': 'high',
+                    'device': device_status['device_name'],
+                    'device_id': device_id,
+                    'expected_driver': expected_driver,
+                    'message': f"USB Wi-Fi device {device_status['device_name']} detected but driver module not found"
+                })
+                
+                add_recommendation({
+                    'type': 'install_driver',
+                    'device': device_status['device_name'],
+                    'device_id': device_id,
+                    'expected_driver': expected_driver,
+                    'message': f"Driver module {expected_driver} not found. May need to install firmware or compile driver.",
+                    'suggestions': [
+                        f"Check if firmware package exists: apt-cache search {expected_driver}",
+                        f"Install firmware: sudo apt-get install firmware-realtek",
+                        f"Or check kernel modules: find /lib/modules/$(uname -r) -name '*{expected_driver}*'"
+                    ]
+                })
+            else:
+                # Driver loaded but not bound
+                add_issue({
+                    'type': 'driver_not_bound',
                     'severity': 'medium',
                     'device': device_status['device_name'],
                     'device_id': device_id,
-                    'message': f"Driver loaded but no network interface detected"
+                    'message': f"Driver module loaded but not bound to device"
                 })
+        elif not device_status['has_interface']:
+            # Driver loaded but no interface
+            add_issue({
+                'type': 'no_interface',
+                'severity': 'medium',
+                'device': device_status['device_name'],
+                'device_id': device_id,
+                'message': f"Driver loaded but no network interface detected"
+            })
     
     diagnostics['wifi_usb_devices'] = wifi_usb_devices
     
@@ -8,10 +8,89 @@ import subprocess
 import time
 import logging
 import os
+import json
+import re
+import threading
+import shutil
 from typing import Optional, Dict, Tuple
 
+# pyroute2 is optional: when installed, link operations go straight to netlink instead of
+# forking `ip` (and `nsenter` for container namespaces) for each step.
+try:
+    from pyroute2 import IPRoute, NetNS
+except ImportError:
+    IPRoute = NetNS = None
+
 logger = logging.getLogger(__name__)
 
+# Resolve the tools once instead of walking PATH on every exec; the bare name is kept as a
+# fallback so a missing binary still fails (and is logged) at call time as before
+IW = shutil.which("iw") or "iw"
+IP = shutil.which("ip") or "ip"
+NSENTER = shutil.which("nsenter") or "nsenter"
+
+# One Docker client (and HTTP connection pool) shared by every manager in the process
+_docker_client = None
+_docker_client_lock = threading.Lock()
+
+
+def get_docker_client() -> docker.DockerClient:
+    """Process-wide Docker client, connected and pinged once on first use (raises on failure)"""
+    global _docker_client
+    if _docker_client is None:
+        with _docker_client_lock:
+            if _docker_client is None:
+                client = docker.from_env()
+                client.ping()
+                _docker_client = client
+    return _docker_client
+
+
+# `iw dev` output: "\tInterface wlan0" lines and "\twiphy 1" lines
+_IW_IFACE_RE = re.compile(r'^\s*Interface\s+(\S+)', re.M)
+_WIPHY_RE = re.compile(r'^\s*wiphy\s+(\d+)', re.M)
+
+# interface -> phy mapping only changes when an adapter is re-plugged or moved between namespaces
+PHY_CACHE_TTL = 30.0
+# Interface topology only changes on hotplug or when interfaces move in/out of containers
+INTERFACE_CACHE_TTL = 2.0
+# Interface name prefixes: never offered to personas / offered as wired NICs
+SKIP_IFACE_PREFIXES = ('lo', 'docker', 'br-', 'pan', 'veth', 'vnet')
+ETH_IFACE_PREFIXES = ('eth', 'enp', 'eno', 'ens')
+# Container PIDs are only stable while the container runs; keep them very briefly
+PID_CACHE_TTL = 1.0
+
+
+def _is_wireless(iface: str) -> bool:
+    """
+    Wi-Fi classification without spawning iw: every nl80211 device (anything `iw dev <iface> info`
+    succeeds on) has a phy80211 link in sysfs, and legacy wext drivers expose wireless/.
+    """
+    if iface.startswith('wl'):
+        return True
+    base = f"/sys/class/net/{iface}"
+    return os.path.isdir(f"{base}/phy80211") or os.path.exists(f"{base}/wireless")
+
+
+def _wait_for_link(ifname: str, pid: int, timeout: float = 0.5) -> bool:
+    """
+    Wait until ifname is present in the network namespace of pid (1 = host).
+    /proc/<pid>/net/dev always reflects that process's namespace, so this returns as soon as
+    the kernel finishes the move instead of stalling for the full timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with open(f"/proc/{pid}/net/dev", 'r') as f:
+                # Two header lines, then "  wlan0: <counters>"
+                if any(line.split(':', 1)[0].strip() == ifname for line in f.readlines()[2:]):
+                    return True
+        except OSError:
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+
 
 class InterfaceManager:
     """Handles moving physical Wi-Fi interfaces into Docker container namespaces."""
@@ -20,46 +99,84 @@ class InterfaceManager:
         # Lazy initialization - don't connect until actually needed
         self.client = None
         self._initialized = False
+        # Serializes client (re)initialization across concurrent dashboard requests
+        self._lock = threading.Lock()
+        # interface -> (resolved_at, phy name); see PHY_CACHE_TTL
+        self._phy_cache: Dict[str, Tuple[float, str]] = {}
+        # container name -> (resolved_at, pid); see PID_CACHE_TTL
+        self._pid_cache: Dict[str, Tuple[float, int]] = {}
+        # include_ethernet -> (scanned_at, interfaces); see INTERFACE_CACHE_TTL
+        self._iface_cache: Dict[bool, Tuple[float, Dict[str, Dict]]] = {}
+        # Host netlink socket (pyroute2), opened on first use and kept for the process lifetime
+        self._ipr = None
+        self._ipr_lock = threading.Lock()
     
     def _ensure_client(self):
         """Lazy initialization of Docker client"""
         if self._initialized and self.client is not None:
             return True
         
-        try:
-            # Try to connect to Docker socket
-            self.client = docker.from_env()
-            # Test the connection
-            self.client.ping()
-            self._initialized = True
-            logger.info("Docker client initialized successfully")
-            return True
-        except docker.errors.DockerException as e:
-            logger.error(f"Failed to initialize Docker client: {e}")
-            logger.error("Make sure Docker socket is accessible: /var/run/docker.sock")
-            self.client = None
-            self._initialized = False
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error initializing Docker client: {e}")
-            self.client = None
-            self._initialized = False
-            return False
+        with self._lock:
+            # Another thread may have connected while we waited for the lock
+            if self._initialized and self.client is not None:
+                return True
+            
+            try:
+                # Connect to the Docker socket (shared with PersonaManager)
+                self.client = get_docker_client()
+                self._initialized = True
+                logger.info("Docker client initialized successfully")
+                return True
+            except docker.errors.DockerException as e:
+                logger.error(f"Failed to initialize Docker client: {e}")
+                logger.error("Make sure Docker socket is accessible: /var/run/docker.sock")
+                self.client = None
+                self._initialized = False
+                return False
+            except Exception as e:
+                logger.error(f"Unexpected error initializing Docker client: {e}")
+                self.client = None
+                self._initialized = False
+                return False
+
+    def _get_container_pid(self, container_name: str) -> int:
+        """Host PID of a container's init process (0 if not running); raises docker.errors.NotFound"""
+        cached = self._pid_cache.get(container_name)
+        if cached and time.monotonic() - cached[0] < PID_CACHE_TTL:
+            return cached[1]
+        # Low-level inspect: same pooled socket, but skips building a Container model
+        pid = self.client.api.inspect_container(container_name)['State']['Pid']
+        # Never cache "not running": the container may be about to start
+        if pid:
+            self._pid_cache[container_name] = (time.monotonic(), pid)
+        return pid
 
     def get_phy_name(self, interface: str) -> Optional[str]:
         """Finds the 'phyX' name for a given 'wlanX' interface."""
+        cached = self._phy_cache.get(interface)
+        if cached and time.monotonic() - cached[0] < PHY_CACHE_TTL:
+            return cached[1]
+        # The phy name is exposed directly in sysfs; only fall back to iw if it isn't there
+        try:
+            with open(f"/sys/class/net/{interface}/phy80211/name", 'r') as f:
+                phy_name = f.read().strip()
+            if phy_name:
+                self._phy_cache[interface] = (time.monotonic(), phy_name)
+                return phy_name
+        except OSError:
+            pass
         try:
             result = subprocess.check_output(
-                ["iw", "dev", interface, "info"],
+                [IW, "dev", interface, "info"],
                 stderr=subprocess.DEVNULL,
                 timeout=5
             ).decode()
             
-            for line in result.split('\n'):
-                if "wiphy" in line:
-                    parts = line.strip().split()
-                    if len(parts) >= 2:
-                        return f"phy{parts[1]}"
+            match = _WIPHY_RE.search(result)
+            if match:
+                phy_name = f"phy{match.group(1)}"
+                self._phy_cache[interface] = (time.monotonic(), phy_name)
+                return phy_name
             
             logger.warning(f"Could not find phy name for {interface}, using phy0 as fallback")
             return "phy0"
@@ -73,11 +190,17 @@ class InterfaceManager:
             logger.error(f"Unexpected error getting phy name: {e}")
             return None
 
+    def invalidate_phy_cache(self, *interfaces: str):
+        """Forget cached phy names for interfaces that moved between namespaces"""
+        for interface in interfaces:
+            self._phy_cache.pop(interface, None)
+
     def move_to_container(
         self, 
         interface: str, 
         container_name: str,
-        target_name: str = "wlan_sim"
+        target_name: str = "wlan_sim",
+        pid: Optional[int] = None
     ) -> Tuple[bool, str]:
         """
         Moves a physical interface (wlanX) into a container's network namespace.
@@ -86,16 +209,17 @@ class InterfaceManager:
             interface: Physical interface name (e.g., "wlan1")
             container_name: Docker container name
             target_name: Name to use inside container (default: "wlan_sim")
+            pid: Container init PID, if the caller already has it (skips the Docker lookup)
         
         Returns:
             Tuple of (success: bool, message: str)
         """
-        if not self._ensure_client():
+        if pid is None and not self._ensure_client():
             return False, "Docker client not available - check Docker socket permissions"
         
         try:
-            container = self.client.containers.get(container_name)
-            pid = container.attrs['State']['Pid']
+            if pid is None:
+                pid = self._get_container_pid(container_name)
             
             if pid == 0:
                 return False, f"Container {container_name} is not running (PID=0)"
@@ -114,15 +238,9 @@ class InterfaceManager:
                 is_wireless = False
 
             # 1. Bring the interface down on the host
-            try:
-                subprocess.run(
-                    ["ip", "link", "set", interface, "down"],
-                    check=True,
-                    timeout=5,
-                    capture_output=True
-                )
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Interface {interface} may already be down: {e}")
+            ok, error_msg = self._link_set(interface, state="down")
+            if not ok:
+                logger.warning(f"Interface {interface} may already be down: {error_msg}")
 
             # 2. Move the interface to the container's namespace
             if is_wireless:
@@ -131,78 +249,42 @@ class InterfaceManager:
                     return False, f"Could not determine phy name for {interface}"
                 try:
                     subprocess.run(
-                        ["iw", "phy", phy_name, "set", "netns", str(pid)],
+                        [IW, "phy", phy_name, "set", "netns", str(pid)],
                         check=True,
                         timeout=10,
-                        capture_output=True
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE
                     )
                     logger.info(f"Successfully moved wireless interface {interface} (phy: {phy_name}) to container namespace")
                 except subprocess.CalledProcessError as e:
                     error_msg = e.stderr.decode() if e.stderr else str(e)
                     return False, f"Failed to move wireless interface to container namespace: {error_msg}"
             else:
-                # For ethernet interfaces, use ip link to move directly
-                try:
-                    subprocess.run(
-                        ["ip", "link", "set", interface, "netns", str(pid)],
-                        check=True,
-                        timeout=10,
-                        capture_output=True
-                    )
-                    logger.info(f"Successfully moved ethernet interface {interface} to container namespace")
-                except subprocess.CalledProcessError as e:
-                    error_msg = e.stderr.decode() if e.stderr else str(e)
+                # For ethernet interfaces, move the link itself
+                ok, error_msg = self._link_set(interface, net_ns_pid=pid)
+                if not ok:
                     return False, f"Failed to move ethernet interface to container namespace: {error_msg}"
+                logger.info(f"Successfully moved ethernet interface {interface} to container namespace")
 
-            # 3. Wait a moment for the interface to appear in the container
-            time.sleep(0.5)
+            # 3. Wait (up to 0.5s) for the interface to appear in the container
+            _wait_for_link(interface, pid)
 
-            # 4. Rename and bring up inside the container via nsenter
-            # Renaming to 'wlan_sim' means traffic scripts are always the same
-            try:
-                # First, find what the interface is called in the container
-                result = subprocess.run(
-                    ["nsenter", "-t", str(pid), "-n", "ip", "link", "show"],
-                    capture_output=True,
-                    timeout=5,
-                    text=True
-                )
-                
-                # Find the interface (it might still be wlanX or already renamed)
-                actual_name = interface
-                for line in result.stdout.split('\n'):
-                    if f": {interface}:" in line or f": {interface}@" in line:
-                        actual_name = interface
-                        break
-                
-                # Rename to standardized name
-                subprocess.run(
-                    ["nsenter", "-t", str(pid), "-n", 
-                     "ip", "link", "set", actual_name, "name", target_name],
-                    check=True,
-                    timeout=5,
-                    capture_output=True
-                )
-                
-                # Bring it up
-                subprocess.run(
-                    ["nsenter", "-t", str(pid), "-n", 
-                     "ip", "link", "set", target_name, "up"],
-                    check=True,
-                    timeout=5,
-                    capture_output=True
-                )
-                
-                logger.info(f"Successfully renamed {interface} to {target_name} in container")
-                return True, f"Interface {interface} moved to container as {target_name}"
-                
-            except subprocess.CalledProcessError as e:
-                error_msg = e.stderr.decode() if e.stderr else str(e)
+            # 4. Rename and bring up inside the container's namespace
+            # Renaming to 'wlan_sim' means traffic scripts are always the same.
+            # The interface keeps its host name when it changes namespace, and the
+            # kernel applies the rename before the UP flag within one request.
+            ok, error_msg = self._link_set(interface, ns_pid=pid, ifname=target_name, state="up")
+            if not ok:
                 logger.error(f"Failed to configure interface in container: {error_msg}")
                 # Try to return interface to host as cleanup
                 self.return_to_host(interface, pid)
                 return False, f"Failed to configure interface in container: {error_msg}"
 
+            logger.info(f"Successfully renamed {interface} to {target_name} in container")
+            self.invalidate_phy_cache(interface, target_name)
+            self.invalidate_interfaces_cache()
+            return True, f"Interface {interface} moved to container as {target_name}"
+
         except docker.errors.NotFound:
             return False, f"Container {container_name} not found"
         except docker.errors.APIError as e:
@@ -218,18 +300,24 @@ class InterfaceManager:
         """
         try:
             container_if = container_interface or interface
+            # Whatever the outcome, the interface is leaving its current namespace
+            self.invalidate_phy_cache(interface, container_if)
+            self.invalidate_interfaces_cache()
             logger.info(
                 f"Returning interface from container namespace: host={interface}, "
                 f"container={container_if}, pid={container_pid}"
             )
             
-            # Check if this is a wireless or ethernet interface
+            # Check if this is a wireless or ethernet interface; the same `iw dev info`
+            # output also carries the PHY index used below
             is_wireless = False
+            result = None
             try:
                 # Try to get PHY name from inside container
                 result = subprocess.run(
-                    ["nsenter", "-t", str(container_pid), "-n", "iw", "dev", container_if, "info"],
-                    capture_output=True,
+                    [NSENTER, "-t", str(container_pid), "-n", IW, "dev", container_if, "info"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
                     timeout=5,
                     text=True
                 )
@@ -242,72 +330,39 @@ class InterfaceManager:
                 # For wireless, try to get PHY and use iw
                 try:
                     phy_name = None
-                    result = subprocess.run(
-                        ["nsenter", "-t", str(container_pid), "-n", "iw", "dev", container_if, "info"],
-                        capture_output=True,
-                        timeout=5,
-                        text=True
-                    )
-                    if result.returncode == 0:
-                        for line in result.stdout.split('\n'):
-                            if "wiphy" in line:
-                                parts = line.strip().split()
-                                if len(parts) >= 2:
-                                    phy_name = f"phy{parts[1]}"
-                                    break
+                    match = _WIPHY_RE.search(result.stdout)
+                    if match:
+                        phy_name = f"phy{match.group(1)}"
                     
                     if phy_name:
                         subprocess.run(
-                            ["nsenter", "-t", str(container_pid), "-n",
-                             "iw", "phy", phy_name, "set", "netns", "1"],
+                            [NSENTER, "-t", str(container_pid), "-n",
+                             IW, "phy", phy_name, "set", "netns", "1"],
                             check=True,
                             timeout=10,
-                            capture_output=True
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL
                         )
                         logger.info(f"Returned wireless interface {container_if} (phy: {phy_name}) to host")
                         # Bring it up on host
-                        time.sleep(0.5)
+                        _wait_for_link(container_if, 1)
                         if container_if != interface:
-                            subprocess.run(
-                                ["ip", "link", "set", container_if, "name", interface],
-                                check=False,
-                                timeout=5,
-                                capture_output=True
-                            )
-                        subprocess.run(
-                            ["ip", "link", "set", interface, "up"],
-                            check=False,
-                            timeout=5,
-                            capture_output=True
-                        )
+                            self._link_set(container_if, ifname=interface)
+                        self._link_set(interface, state="up")
                         return True
                 except Exception as e:
                     logger.warning(f"Failed to return wireless interface using iw: {e}, trying ip link")
             
-            # For ethernet or as fallback, use ip link
-            subprocess.run(
-                ["nsenter", "-t", str(container_pid), "-n", 
-                 "ip", "link", "set", container_if, "netns", "1"],
-                check=True,
-                timeout=10,
-                capture_output=True
-            )
+            # For ethernet or as fallback, move the link itself
+            ok, error_msg = self._link_set(container_if, ns_pid=container_pid, net_ns_pid=1)
+            if not ok:
+                raise subprocess.CalledProcessError(1, "ip link set netns 1", stderr=error_msg)
             
             # Bring it up on host
-            time.sleep(0.5)
+            _wait_for_link(container_if, 1)
             if container_if != interface:
-                subprocess.run(
-                    ["ip", "link", "set", container_if, "name", interface],
-                    check=False,
-                    timeout=5,
-                    capture_output=True
-                )
-            subprocess.run(
-                ["ip", "link", "set", interface, "up"],
-                check=False,  # Don't fail if already up
-                timeout=5,
-                capture_output=True
-            )
+                self._link_set(container_if, ifname=interface)
+            self._link_set(interface, state="up")  # Don't fail if already up
             
             logger.info(f"Successfully returned interface to host as {interface}")
             return True
@@ -319,11 +374,12 @@ class InterfaceManager:
                 phy_name = self.get_phy_name(container_if)
                 if phy_name:
                     subprocess.run(
-                        ["nsenter", "-t", str(container_pid), "-n",
-                         "iw", "phy", phy_name, "set", "netns", "1"],
+                        [NSENTER, "-t", str(container_pid), "-n",
+                         IW, "phy", phy_name, "set", "netns", "1"],
                         check=True,
                         timeout=10,
-                        capture_output=True
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL
                     )
                     return True
             except Exception as e2:
@@ -334,10 +390,92 @@ class InterfaceManager:
             logger.exception(f"Unexpected error returning interface to host: {e}")
             return False
 
+    def _host_netlink(self, fn):
+        """
+        Run fn(ipr) against the shared host IPRoute socket, one caller at a time.
+        The socket is dropped on any error and reopened by the next call.
+        """
+        with self._ipr_lock:
+            try:
+                if self._ipr is None:
+                    self._ipr = IPRoute()
+                return fn(self._ipr)
+            except Exception:
+                if self._ipr is not None:
+                    try:
+                        self._ipr.close()
+                    except Exception:
+                        pass
+                    self._ipr = None
+                raise
+
+    def _link_set(self, link: str, ns_pid: Optional[int] = None, **attrs) -> Tuple[bool, str]:
+        """
+        `ip link set` for state="up"/"down", ifname=<new name> and/or net_ns_pid=<pid>.
+        Runs on the host, or inside the network namespace of ns_pid when given.
+        Returns (success, error message) rather than raising.
+        """
+        if IPRoute is not None:
+            def apply(ipr):
+                index = ipr.link_lookup(ifname=link)
+                if not index:
+                    return False, f'Device "{link}" does not exist.'
+                ipr.link("set", index=index[0], **attrs)
+                return True, ""
+            try:
+                if not ns_pid:
+                    return self._host_netlink(apply)
+                # NetNS does the setns() in a forked helper, so this thread's namespace is untouched
+                with NetNS(f"/proc/{ns_pid}/ns/net") as ipr:
+                    return apply(ipr)
+            except Exception as e:
+                return False, str(e)
+        
+        args = [IP, "link", "set", link]
+        if ns_pid:
+            args = [NSENTER, "-t", str(ns_pid), "-n"] + args
+        for key, value in attrs.items():
+            args += {"state": [value], "ifname": ["name", value], "net_ns_pid": ["netns", str(value)]}[key]
+        result = subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=10, text=True)
+        return result.returncode == 0, result.stderr.strip()
+
+    def _ip_links(self) -> Dict[str, Dict]:
+        """All host links keyed by ifname, shaped like `ip -json link show` entries ({} on failure)"""
+        if IPRoute is not None:
+            try:
+                links = {}
+                for msg in self._host_netlink(lambda ipr: list(ipr.get_links())):
+                    ifname = msg.get_attr('IFLA_IFNAME')
+                    links[ifname] = {
+                        'ifname': ifname,
+                        'operstate': msg.get_attr('IFLA_OPERSTATE'),
+                    }
+                return links
+            except Exception as e:
+                logger.debug(f"netlink link dump failed: {e}")
+        try:
+            result = subprocess.run(
+                [IP, "-json", "link", "show"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+                text=True
+            )
+            if result.returncode == 0:
+                return {link['ifname']: link for link in json.loads(result.stdout) if 'ifname' in link}
+        except Exception as e:
+            logger.debug(f"ip -json link show failed: {e}")
+        return {}
+
+    def invalidate_interfaces_cache(self):
+        """Force the next list_available_interfaces() to rescan"""
+        self._iface_cache.clear()
+
     def list_available_interfaces(self, include_ethernet: bool = True) -> Dict[str, Dict]:
         """
         List all available network interfaces on the host.
         Uses multiple methods to ensure we catch all interfaces.
+        Results are cached for INTERFACE_CACHE_TTL seconds; callers get a copy they may mutate.
         
         Args:
             include_ethernet: If True, also include ethernet interfaces (for wired personas)
@@ -345,160 +483,68 @@ class InterfaceManager:
         Returns:
             dict mapping interface name to metadata.
         """
+        cached = self._iface_cache.get(include_ethernet)
+        if cached is None or time.monotonic() - cached[0] >= INTERFACE_CACHE_TTL:
+            cached = (time.monotonic(), self._scan_interfaces(include_ethernet))
+            self._iface_cache[include_ethernet] = cached
+        return {name: dict(info) for name, info in cached[1].items()}
+
+    def _scan_interfaces(self, include_ethernet: bool) -> Dict[str, Dict]:
+        """Uncached interface discovery behind list_available_interfaces()"""
         interfaces = {}
         
         try:
             # Method 1: Use 'iw dev' to find all wireless interfaces (most reliable)
             try:
                 iw_result = subprocess.run(
-                    ["iw", "dev"],
-                    capture_output=True,
+                    [IW, "dev"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
                     timeout=5,
                     text=True
                 )
                 if iw_result.returncode == 0:
-                    current_iface = None
-                    for line in iw_result.stdout.split('\n'):
-                        # Look for "Interface wlanX" lines
-                        if 'Interface' in line:
-                            parts = line.split()
-                            if len(parts) >= 2:
-                                current_iface = parts[1].strip()
-                                # Initialize interface entry
-                                if current_iface not in interfaces:
-                                    interfaces[current_iface] = {
-                                        'name': current_iface,
-                                        'type': 'wifi',
-                                        'state': 'unknown',
-                                        'available': True
-                                    }
-            except Exception as e:
-                logger.debug(f"iw dev failed: {e}")
-            
-            # Method 2: Use 'ip link show' to find all network interfaces
-            try:
-                ip_result = subprocess.run(
-                    ["ip", "link", "show"],
-                    capture_output=True,
-                    timeout=5,
-                    text=True
-                )
-                
-                current_iface = None
-                for line in ip_result.stdout.split('\n'):
-                    # Interface line: "2: wlan1: <BROADCAST,MULTICAST,UP,LOWER_UP>"
-                    if ':' in line:
-                        parts = line.split(':')
-                        if len(parts) >= 2:
-                            potential_iface = parts[1].strip().split('@')[0]  # Remove @link suffix
-
-                            # Check if it's a wireless interface (wlan/wlp/wlx or via sysfs/iw probe)
-                            is_wifi = False
-                            wireless_sysfs = f"/sys/class/net/{potential_iface}/wireless"
-                            if potential_iface.startswith('wl') or os.path.exists(wireless_sysfs):
-                                is_wifi = True
-                            else:
-                                # Check if it's a wireless interface using iw
-                                try:
-                                    check_result = subprocess.run(
-                                        ["iw", "dev", potential_iface, "info"],
-                                        capture_output=True,
-                                        timeout=2,
-                                        text=True
-                                    )
-                                    if check_result.returncode == 0:
-                                        is_wifi = True
-                                except:
-                                    pass  # Not a wireless interface
-                            
-                            if is_wifi:
-                                current_iface = potential_iface
-                                if current_iface not in interfaces:
-                                    interfaces[current_iface] = {
-                                        'name': current_iface,
-                                        'type': 'wifi',
-                                        'state': 'unknown',
-                                        'available': True
-                                    }
-            except Exception as e:
-                logger.debug(f"ip link show failed: {e}")
-            
-            # Method 3: Check /sys/class/net/ for any interfaces we might have missed
-            try:
-                if os.path.exists('/sys/class/net'):
-                    for iface_name in os.listdir('/sys/class/net'):
-                        # Skip loopback and virtual interfaces
-                        if iface_name.startswith('lo') or iface_name.startswith('docker') or iface_name.startswith('br-'):
-                            continue
-                        
-                        # Check if it's a wireless interface
-                        is_wifi = False
-                        wireless_sysfs = f"/sys/class/net/{iface_name}/wireless"
-                        if iface_name.startswith('wl') or os.path.exists(wireless_sysfs):
-                            is_wifi = True
-                        else:
-                            # Check using iw
-                            try:
-                                check_result = subprocess.run(
-                                    ["iw", "dev", iface_name, "info"],
-                                    capture_output=True,
-                                    timeout=2,
-                                    text=True
-                                )
-                                if check_result.returncode == 0:
-                                    is_wifi = True
-                            except:
-                                pass
-                        
-                        if is_wifi and iface_name not in interfaces:
-                            interfaces[iface_name] = {
-                                'name': iface_name,
+                    # Look for "Interface wlanX" lines
+                    for match in _IW_IFACE_RE.finditer(iw_result.stdout):
+                        current_iface = match.group(1)
+                        # Initialize interface entry
+                        if current_iface not in interfaces:
+                            interfaces[current_iface] = {
+                                'name': current_iface,
                                 'type': 'wifi',
                                 'state': 'unknown',
                                 'available': True
                             }
             except Exception as e:
+                logger.debug(f"iw dev failed: {e}")
+            
+            # Methods 2-4: one pass over every host link ('ip -json link show' or netlink, plus
+            # /sys/class/net for anything it missed) classifies each name once. The link list
+            # is reused below for link state instead of re-running ip per interface.
+            links = self._ip_links()
+            try:
+                sysfs_names = os.listdir('/sys/class/net')
+            except OSError as e:
                 logger.debug(f"sys/class/net check failed: {e}")
+                sysfs_names = []
             
-            # Method 4: Add ethernet interfaces if requested (for wired personas)
-            if include_ethernet:
-                try:
-                    ip_result = subprocess.run(
-                        ["ip", "link", "show"],
-                        capture_output=True,
-                        timeout=5,
-                        text=True
-                    )
-                    
-                    for line in ip_result.stdout.split('\n'):
-                        if ':' in line:
-                            parts = line.split(':')
-                            if len(parts) >= 2:
-                                potential_iface = parts[1].strip().split('@')[0]
-                                
-                                # Check if it's an ethernet interface (eth, enp, eno, etc.)
-                                is_ethernet = False
-                                if potential_iface.startswith('eth') or \
-                                   potential_iface.startswith('enp') or \
-                                   potential_iface.startswith('eno') or \
-                                   potential_iface.startswith('ens'):
-                                    is_ethernet = True
-                                
-                                # Skip if already added or if it's a virtual interface
-                                if is_ethernet and potential_iface not in interfaces:
-                                    # Skip loopback, docker, bridge interfaces
-                                    if not potential_iface.startswith('lo') and \
-                                       not potential_iface.startswith('docker') and \
-                                       not potential_iface.startswith('br-') and \
-                                       not potential_iface.startswith('pan'):
-                                        interfaces[potential_iface] = {
-                                            'name': potential_iface,
-                                            'type': 'ethernet',
-                                            'state': 'unknown',
-                                            'available': True
-                                        }
-                except Exception as e:
-                    logger.debug(f"Failed to add ethernet interfaces: {e}")
+            for iface_name in dict.fromkeys([*links, *sysfs_names]):
+                # Skip loopback and virtual interfaces
+                if iface_name in interfaces or iface_name.startswith(SKIP_IFACE_PREFIXES):
+                    continue
+                # Wireless (wlan/wlp/wlx or via sysfs), or ethernet if requested (for wired personas)
+                if _is_wireless(iface_name):
+                    iface_type = 'wifi'
+                elif include_ethernet and iface_name.startswith(ETH_IFACE_PREFIXES):
+                    iface_type = 'ethernet'
+                else:
+                    continue
+                interfaces[iface_name] = {
+                    'name': iface_name,
+                    'type': iface_type,
+                    'state': 'unknown',
+                    'available': True
+                }
             
             # Filter out interfaces we don't want to show
             interfaces_to_remove = []
@@ -506,32 +552,8 @@ class InterfaceManager:
                 # Skip monitor interfaces (mon0, mon1, etc.)
                 if iface_name.startswith('mon'):
                     interfaces_to_remove.append(iface_name)
-                    continue
-                
-                # Check if interface is in a container namespace (not on host)
-                # If we can't get info about it from the host, it's probably in a container
-                try:
-                    result = subprocess.run(
-                        ["iw", "dev", iface_name, "info"],
-                        capture_output=True,
-                        timeout=2,
-                        text=True
-                    )
-                    # If iw fails, it might be in a container - but don't remove yet,
-                    # let's check with ip link instead
-                    if result.returncode != 0:
-                        ip_result = subprocess.run(
-                            ["ip", "link", "show", iface_name],
-                            capture_output=True,
-                            timeout=2,
-                            text=True
-                        )
-                        # If both fail, interface doesn't exist on host (might be in container)
-                        if ip_result.returncode != 0:
-                            # Don't remove - might just be down, let it through
-                            pass
-                except:
-                    pass  # Keep the interface if we can't check
+                # Interfaces missing from the host link list may be in a container or just down;
+                # they are kept either way
             
             # Remove filtered interfaces
             for iface_name in interfaces_to_remove:
@@ -552,18 +574,12 @@ class InterfaceManager:
                                 "(consider renaming back to wlanX)."
                             )
                     
-                    # Get interface state
-                    state_result = subprocess.run(
-                        ["ip", "link", "show", iface_name],
-                        capture_output=True,
-                        timeout=5,
-                        text=True
-                    )
-                    if state_result.returncode == 0:
-                        state = 'DOWN'
-                        if 'state UP' in state_result.stdout or 'UP' in state_result.stdout:
-                            state = 'UP'
-                        interfaces[iface_name]['state'] = state
+                    # Get interface state from the link list fetched above
+                    # (operational state: UP/DOWN/DORMANT/UNKNOWN, not the administrative UP flag,
+                    # which is set on any enabled link whether or not it has carrier)
+                    link = links.get(iface_name)
+                    if link is not None:
+                        interfaces[iface_name]['state'] = (link.get('operstate') or 'unknown').upper()
                     else:
                         interfaces[iface_name]['state'] = 'DOWN'
                         
@@ -587,21 +603,13 @@ class InterfaceManager:
     def get_interface_status(self, interface: str) -> Dict:
         """Get current status of an interface."""
         try:
-            result = subprocess.run(
-                ["ip", "link", "show", interface],
-                capture_output=True,
-                timeout=5,
-                text=True
-            )
-            
-            if result.returncode != 0:
+            # Operational state straight from sysfs: up/down/dormant/unknown/...
+            try:
+                with open(f"/sys/class/net/{interface}/operstate", 'r') as f:
+                    state = f.read().strip().upper()
+            except FileNotFoundError:
                 return {'exists': False}
             
-            # Parse interface state
-            state = 'DOWN'
-            if 'state UP' in result.stdout:
-                state = 'UP'
-            
             phy_name = self.get_phy_name(interface)
             
             return {
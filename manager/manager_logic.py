@@ -3,18 +3,56 @@ Manager Logic: Handles container lifecycle and persona management.
 This module orchestrates the creation, management, and cleanup of persona containers.
 """
 
+import atexit
 import docker
 import logging
 import json
 import os
 import time
+import threading
 import subprocess
+from collections import deque
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-from .interface_manager import InterfaceManager
+from .interface_manager import InterfaceManager, get_docker_client
 
 logger = logging.getLogger(__name__)
 
+# How long a persona container listing is reused before Docker is asked again;
+# start/stop drop it immediately
+CONTAINER_LIST_TTL = 5.0
+# ...and while a Docker events subscription invalidates it on every persona container event,
+# only as a safety net against a missed event
+CONTAINER_LIST_EVENT_TTL = 60.0
+# Label stamped on every persona container so listings can be filtered server-side
+PERSONA_LABEL = ('app', 'wifi-dashboard')
+# Bursts of state mutations are coalesced into one personas.json write at most this often
+STATE_FLUSH_INTERVAL = 1.0
+# Per-container stats are reused this long to absorb dashboard polling bursts
+STATS_CACHE_TTL = 2.0
+# An older CPU baseline is dropped rather than averaged over (e.g. after a long gap in polling)
+CPU_BASELINE_MAX_AGE = 30.0
+
+# Shared read-only stand-in for missing nested dicts in Docker stats payloads
+_EMPTY = MappingProxyType({})
+
+# Local ISO timestamps (T- and space-separated), formatted at most once per wall-clock second
+_iso_cache = (0, "", "")
+
+
+def now_iso(sep: str = "T") -> str:
+    """Return the current local time as an ISO string with second resolution (sep: 'T' or ' ')"""
+    global _iso_cache
+    now = int(time.time())
+    cached = _iso_cache
+    if cached[0] != now:
+        iso = datetime.fromtimestamp(now).isoformat()
+        cached = (now, iso, iso.replace("T", " ", 1))
+        _iso_cache = cached
+    return cached[2] if sep == " " else cached[1]
+
 
 class PersonaManager:
     """Manages persona container lifecycles and interface assignments."""
@@ -49,6 +87,18 @@ class PersonaManager:
         }
     }
     
+    # Container environment derived purely from PERSONA_CONFIGS, rendered once per persona type
+    BASE_ENV = {
+        persona_type: MappingProxyType({
+            'PERSONA_TYPE': persona_type,
+            'INTERFACE': 'eth_sim' if persona_type == 'wired' else 'wlan_sim',  # Standardized name inside container
+            'HOSTNAME': config['hostname'],
+            'TRAFFIC_INTENSITY': config.get('traffic_intensity', 'medium'),
+            'ROAMING_ENABLED': str(config.get('roaming_enabled', False)).lower(),
+        })
+        for persona_type, config in PERSONA_CONFIGS.items()
+    }
+    
     def __init__(self, state_dir: str = "/app/state"):
         # Lazy initialization - don't connect to Docker until needed
         self.client = None
@@ -57,9 +107,39 @@ class PersonaManager:
         self.state_dir = state_dir
         self.state_file = os.path.join(state_dir, "personas.json")
         os.makedirs(state_dir, exist_ok=True)
+        # Guards self.state: the manager is shared by gunicorn's request threads
+        self._state_lock = threading.RLock()
+        # Serializes snapshot + write so an older snapshot can never land on disk last
+        self._save_lock = threading.Lock()
+        # Shared, bounded pool for Docker API fan-out (per-persona log fetches, parallel stops);
+        # dockerd serializes much of the work anyway, so more threads would only thrash
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="persona-docker")
+        # Set by _save_state(); the flush thread writes the file shortly after
+        self._dirty = threading.Event()
+        # (listed_at, persona containers of any status); see CONTAINER_LIST_TTL
+        self._container_cache: Optional[Tuple[float, List]] = None
+        # Bumped on every invalidation so a listing fetched across one is never stored
+        self._container_cache_gen = 0
+        # Set by whoever watches Docker events and calls invalidate_container_cache() on each
+        # persona container event (the dashboard's watcher thread)
+        self.container_events_live = False
+        # Containers started before PERSONA_LABEL existed are only found by name; switch to
+        # the label filter once a listing shows none of them are left
+        self._label_filter = False
+        # container -> (sampled_at, stats result); see STATS_CACHE_TTL
+        self._stats_cache: Dict[str, Tuple[float, Dict]] = {}
+        # container -> (sampled_at, previous raw cpu_stats), the baseline for the next one-shot
+        # sample; see CPU_BASELINE_MAX_AGE
+        self._cpu_samples: Dict[str, Tuple[float, Dict]] = {}
         
         # Load persisted state (doesn't require Docker)
         self.state = self._load_state()
+        # container id -> assigned interface; mirrors self.state['interfaces'] (see _reindex_interfaces)
+        self._iface_by_cid: Dict[str, str] = {}
+        self._reindex_interfaces()
+        threading.Thread(target=self._flush_loop, name="persona-state-flush", daemon=True).start()
+        # The flush thread is a daemon; write anything still pending on interpreter exit
+        atexit.register(self.flush_state)
         logger.info(f"PersonaManager initialized with state_dir: {state_dir}")
     
     def _ensure_client(self):
@@ -68,8 +148,8 @@ class PersonaManager:
             return True
         
         try:
-            self.client = docker.from_env()
-            self.client.ping()
+            # Shared with the InterfaceManager: one connection pool, one ping per process
+            self.client = get_docker_client()
             self._client_initialized = True
             logger.info("Docker client initialized successfully")
             return True
@@ -84,39 +164,90 @@ class PersonaManager:
             self.client = None
             self._client_initialized = False
             return False
-            
-            # Load persisted state
-            self.state = self._load_state()
-            
-            logger.info(f"PersonaManager initialized with state_dir: {state_dir}")
-            
-        except docker.errors.DockerException as e:
-            logger.error(f"Failed to connect to Docker: {e}")
-            raise
-        except Exception as e:
-            logger.exception(f"Failed to initialize PersonaManager: {e}")
-            raise
+
+    def _get_persona_containers(self, force: bool = False) -> List:
+        """All persona containers (any status), reusing a listing younger than CONTAINER_LIST_TTL"""
+        cached = self._container_cache
+        ttl = CONTAINER_LIST_EVENT_TTL if self.container_events_live else CONTAINER_LIST_TTL
+        if force or cached is None or time.monotonic() - cached[0] >= ttl:
+            gen = self._container_cache_gen
+            if self._label_filter:
+                filters = {'label': '='.join(PERSONA_LABEL)}
+            else:
+                filters = {'name': 'persona-'}
+            cached = (time.monotonic(), self.client.containers.list(all=True, filters=filters))
+            if not self._label_filter and all(
+                    (c.labels or {}).get(PERSONA_LABEL[0]) == PERSONA_LABEL[1] for c in cached[1]):
+                self._label_filter = True
+            if gen == self._container_cache_gen:
+                self._container_cache = cached
+        return cached[1]
+
+    def invalidate_container_cache(self):
+        """Drop the cached container listing (persona started/stopped, or a container event)"""
+        self._container_cache_gen += 1
+        self._container_cache = None
+
+    def _reindex_interfaces(self):
+        """Rebuild the container id -> interface index after bulk changes to state['interfaces']"""
+        with self._state_lock:
+            self._iface_by_cid = {
+                info['container_id']: iface
+                for iface, info in self.state['interfaces'].items()
+                if info.get('container_id')
+            }
 
     def _load_state(self) -> Dict:
-        """Load persisted persona state from disk."""
+        """Load persisted persona state from disk (always with 'personas' and 'interfaces' dicts)."""
+        state = {}
         try:
             if os.path.exists(self.state_file):
                 with open(self.state_file, 'r') as f:
-                    return json.load(f)
+                    state = json.load(f)
         except Exception as e:
             logger.warning(f"Failed to load state: {e}")
-        return {
-            'personas': {},
-            'interfaces': {},
-            'last_updated': None
-        }
+        # Normalize once so the rest of the class can subscript directly
+        if not isinstance(state, dict):
+            logger.warning("Ignoring malformed state file")
+            state = {}
+        state.setdefault('personas', {})
+        state.setdefault('interfaces', {})
+        state.setdefault('last_updated', None)
+        return state
 
     def _save_state(self):
-        """Persist persona state to disk."""
+        """Mark state dirty; the flush thread persists it within STATE_FLUSH_INTERVAL."""
+        self._dirty.set()
+
+    def _flush_loop(self):
+        """Background writer: waits for a mutation, lets the burst settle, then saves once."""
+        while True:
+            self._dirty.wait()
+            time.sleep(STATE_FLUSH_INTERVAL)
+            self.flush_state()
+
+    def flush_state(self):
+        """Write pending state to disk now (no-op when nothing changed)."""
+        if not self._dirty.is_set():
+            return
+        # Cleared before the write so a mutation made meanwhile triggers another flush
+        self._dirty.clear()
+        self._write_state()
+
+    def _write_state(self):
+        """Persist persona state to disk (atomically: a crash never leaves a truncated file)."""
         try:
-            self.state['last_updated'] = datetime.now().isoformat()
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
+            with self._save_lock:
+                # Serialize under the lock so a concurrent request can't mutate the dict mid-dump
+                with self._state_lock:
+                    self.state['last_updated'] = now_iso()
+                    data = json.dumps(self.state, indent=2)
+                tmp_path = f"{self.state_file}.tmp"
+                with open(tmp_path, 'w') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.state_file)
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
 
@@ -246,23 +377,26 @@ class PersonaManager:
                 "Choose a non-management interface."
             ), None
 
-        # Clean up stale state first
-        self._cleanup_stale_state()
+        # Clean up stale state first against a fresh listing, which is reused below
+        container_status = self._cleanup_stale_state(force=True)
         
         # Check if interface is already assigned
-        if interface in self.state.get('interfaces', {}):
+        if interface in self.state['interfaces']:
             existing = self.state['interfaces'][interface]
             container_id = existing.get('container_id')
             container_name = existing.get('container_name')
             
             # Verify the container actually exists and is running
             container_running = False
-            if self._ensure_client():
+            if container_status is not None:
+                status = container_status.get(container_id) or container_status.get(container_name)
+                container_running = status == 'running'
+            elif self._ensure_client():
                 try:
                     if container_id:
                         try:
+                            # containers.get() already inspects; no reload() needed
                             c = self.client.containers.get(container_id)
-                            c.reload()
                             if c.status == 'running':
                                 container_running = True
                         except docker.errors.NotFound:
@@ -270,7 +404,6 @@ class PersonaManager:
                     if not container_running and container_name:
                         try:
                             c = self.client.containers.get(container_name)
-                            c.reload()
                             if c.status == 'running':
                                 container_running = True
                         except docker.errors.NotFound:
@@ -283,7 +416,9 @@ class PersonaManager:
             else:
                 # Container missing or not running, clean up stale assignment
                 logger.info(f"Removing stale interface assignment for {interface} (container {container_name} is missing or not running)")
-                del self.state['interfaces'][interface]
+                with self._state_lock:
+                    del self.state['interfaces'][interface]
+                    self._iface_by_cid.pop(container_id, None)
                 self._save_state()
 
         config = self.PERSONA_CONFIGS[persona_type]
@@ -294,14 +429,7 @@ class PersonaManager:
             logger.info(f"Creating persona container: {container_name}")
             
             # Build environment variables
-            env_vars = {
-                'PERSONA_TYPE': persona_type,
-                'INTERFACE': 'eth_sim' if persona_type == 'wired' else 'wlan_sim',  # Standardized name inside container
-                'HOST_INTERFACE': interface,
-                'HOSTNAME': config['hostname'],
-                'TRAFFIC_INTENSITY': config.get('traffic_intensity', 'medium'),
-                'ROAMING_ENABLED': str(config.get('roaming_enabled', False)).lower(),
-            }
+            env_vars = {**self.BASE_ENV[persona_type], 'HOST_INTERFACE': interface}
             
             if ssid:
                 env_vars['SSID'] = ssid
@@ -327,6 +455,9 @@ class PersonaManager:
                 pid_mode='host',  # Need host PID namespace for interface operations
                 privileged=True,  # Required for Wi-Fi operations
                 environment=env_vars,
+                # Lets stop_persona recover the assignment even if state was lost
+                labels={PERSONA_LABEL[0]: PERSONA_LABEL[1], 'wifi.interface': interface,
+                        'wifi.persona_type': persona_type},
                 detach=True,
                 auto_remove=False,  # We'll handle cleanup
                 volumes={
@@ -336,10 +467,22 @@ class PersonaManager:
 
             # Start container
             container.start()
+            self.invalidate_container_cache()
             logger.info(f"Started container: {container_name} (ID: {container.id})")
 
-            # Wait a moment for container to initialize
-            time.sleep(2)
+            # Wait (up to 2s) until the container's init process exists; the entrypoint
+            # itself waits for the interface to show up
+            pid = None
+            deadline = time.monotonic() + 2.0
+            while True:
+                container.reload()
+                state = container.attrs.get('State', {})
+                if state.get('Running') and state.get('Pid', 0) > 0:
+                    pid = state['Pid']
+                    break
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(0.05)
 
             # Move interface into container
             # For wired personas, use 'eth_sim' as the target name, otherwise 'wlan_sim'
@@ -347,7 +490,8 @@ class PersonaManager:
             success, msg = self.interface_manager.move_to_container(
                 interface=interface,
                 container_name=container_name,
-                target_name=target_name
+                target_name=target_name,
+                pid=pid
             )
 
             if not success:
@@ -360,22 +504,26 @@ class PersonaManager:
                 return False, f"Failed to move interface: {msg}", None
 
             # Update state
-            self.state.setdefault('personas', {})[container.id] = {
-                'container_name': container_name,
-                'persona_type': persona_type,
-                'interface': interface,
-                'hostname': config['hostname'],
-                'created_at': datetime.now().isoformat(),
-                'status': 'running'
-            }
-            
-            self.state.setdefault('interfaces', {})[interface] = {
-                'container_id': container.id,
-                'container_name': container_name,
-                'persona_type': persona_type,
-                'assigned_at': datetime.now().isoformat()
-            }
+            with self._state_lock:
+                self.state['personas'][container.id] = {
+                    'container_name': container_name,
+                    'persona_type': persona_type,
+                    'interface': interface,
+                    'hostname': config['hostname'],
+                    'created_at': now_iso(),
+                    'status': 'running'
+                }
+                
+                self.state['interfaces'][interface] = {
+                    'container_id': container.id,
+                    'container_name': container_name,
+                    'persona_type': persona_type,
+                    'assigned_at': now_iso()
+                }
+                self._iface_by_cid[container.id] = interface
             
+            # A listing taken before the container existed would flag the new state as stale
+            self.invalidate_container_cache()
             self._save_state()
 
             return True, f"Persona {persona_type} started on {interface}", container.id
@@ -388,13 +536,19 @@ class PersonaManager:
             logger.exception(f"Failed to start persona: {e}")
             return False, f"Unexpected error: {str(e)}", None
 
-    def stop_persona(self, container_id: Optional[str] = None, container_name: Optional[str] = None) -> Tuple[bool, str]:
+    def stop_persona(
+        self,
+        container_id: Optional[str] = None,
+        container_name: Optional[str] = None,
+        graceful: bool = False
+    ) -> Tuple[bool, str]:
         """
         Stop a persona container and return its interface to the host.
         
         Args:
             container_id: Docker container ID
             container_name: Docker container name (alternative to ID)
+            graceful: Give the container 10s (instead of 1s) to exit on SIGTERM before SIGKILL
         
         Returns:
             Tuple of (success: bool, message: str)
@@ -414,22 +568,23 @@ class PersonaManager:
             container_name = container.name
 
             # Get interface from state
-            interface = None
+            interface = self._iface_by_cid.get(container_id)
             persona_type = None
-            for iface, info in self.state.get('interfaces', {}).items():
-                if info.get('container_id') == container_id:
-                    interface = iface
-                    persona_type = info.get('persona_type')
-                    break
+            if interface:
+                persona_type = self.state['interfaces'].get(interface, {}).get('persona_type')
 
             if not interface:
-                # Try to get from container metadata
+                # Try to get from container metadata (labels, or the env of older containers)
                 logger.warning(f"Interface not found in state for {container_name}, attempting recovery")
-                interface = 'wlan_sim'  # Fallback
+                labels = container.labels or {}
+                env_map = dict(
+                    item.split('=', 1) for item in container.attrs.get('Config', {}).get('Env') or [] if '=' in item
+                )
+                interface = labels.get('wifi.interface') or env_map.get('HOST_INTERFACE') or 'wlan_sim'  # Fallback
+                persona_type = labels.get('wifi.persona_type') or env_map.get('PERSONA_TYPE')
 
-            # Get container PID before stopping
+            # Get container PID before stopping (containers.get() above just inspected it)
             try:
-                container.reload()
                 pid = container.attrs['State']['Pid']
             except:
                 pid = None
@@ -448,7 +603,10 @@ class PersonaManager:
 
             # Stop container
             try:
-                container.stop(timeout=10)
+                # The interface is already back on the host and personas keep no state; their
+                # bash entrypoint runs as PID 1 without a TERM trap, so a long grace period
+                # only delays the inevitable SIGKILL
+                container.stop(timeout=10 if graceful else 1)
                 logger.info(f"Stopped container: {container_name}")
             except docker.errors.NotFound:
                 logger.warning(f"Container {container_name} not found (may already be stopped)")
@@ -461,13 +619,17 @@ class PersonaManager:
                 logger.info(f"Removed container: {container_name}")
             except:
                 pass
+            self.invalidate_container_cache()
+            self._forget_stats(container_id, container_name)
 
             # Update state
-            if container_id in self.state.get('personas', {}):
-                del self.state['personas'][container_id]
-            
-            if interface and interface in self.state.get('interfaces', {}):
-                del self.state['interfaces'][interface]
+            with self._state_lock:
+                if container_id in self.state['personas']:
+                    del self.state['personas'][container_id]
+                
+                # A recovered interface name may now be assigned to another container
+                if self._iface_by_cid.pop(container_id, None) == interface:
+                    self.state['interfaces'].pop(interface, None)
             
             self._save_state()
 
@@ -481,150 +643,148 @@ class PersonaManager:
             logger.exception(f"Failed to stop persona: {e}")
             return False, f"Error: {str(e)}"
 
-    def _cleanup_stale_state(self):
-        """Remove state entries for containers that no longer exist or are not running."""
+    def _cleanup_stale_state(self, force: bool = False) -> Optional[Dict[str, str]]:
+        """
+        Remove state entries for containers that no longer exist or are not running.
+        Works from the cached container listing unless force is set.
+        Returns the persona container statuses it saw, keyed by both id and name
+        (None if Docker could not be queried).
+        """
         if not self._ensure_client():
-            return
+            return None
         
         try:
             # Get all actual persona containers and their statuses
-            actual_containers = set()
-            container_status = {}
-            all_containers = self.client.containers.list(all=True, filters={'name': 'persona-'})
-            for container in all_containers:
-                actual_containers.add(container.id)
-                actual_containers.add(container.name)
-                container_status[container.id] = container.status
-                container_status[container.name] = container.status
-            
-            # Clean up personas that don't exist OR are not running
-            personas_to_remove = []
-            for container_id, persona_info in self.state.get('personas', {}).items():
-                container_name = persona_info.get('container_name')
-                if container_id not in actual_containers and container_name not in actual_containers:
-                    personas_to_remove.append(container_id)
-                    logger.info(f"Cleaning up stale persona state: {persona_info.get('container_name')} (container doesn't exist)")
-                else:
-                    # Container exists, but remove stale state if it is not running
-                    status = container_status.get(container_id) or container_status.get(container_name)
-                    if status and status != 'running':
-                        personas_to_remove.append(container_id)
-                        logger.info(
-                            f"Cleaning up stale persona state: {persona_info.get('container_name')} "
-                            f"(container status: {status})"
-                        )
+            all_containers = self._get_persona_containers(force)
+            status_by_id = {c.id: c.status for c in all_containers}
+            status_by_name = {c.name: c.status for c in all_containers}
+
+            def stale_reason(container_id, container_name):
+                """Why a state entry is stale, or None if its container is running"""
+                status = status_by_id.get(container_id) or status_by_name.get(container_name)
+                if status is None:
+                    return "container doesn't exist"
+                return None if status == 'running' else f"container status: {status}"
+
+            # Held across both sweeps so the flush thread never dumps a half-cleaned state
+            with self._state_lock:
+                personas = self.state['personas']
+                interfaces = self.state['interfaces']
             
-            for container_id in personas_to_remove:
-                # Remove from personas
-                if container_id in self.state.get('personas', {}):
-                    persona_info = self.state['personas'][container_id]
+                # Clean up personas that don't exist OR are not running, together with their
+                # interface assignment
+                personas_removed = 0
+                for container_id, persona_info in list(personas.items()):
+                    container_name = persona_info.get('container_name')
+                    reason = stale_reason(container_id, container_name)
+                    if reason is None:
+                        continue
+                    logger.info(f"Cleaning up stale persona state: {container_name} ({reason})")
+                    del personas[container_id]
+                    personas_removed += 1
                     interface = persona_info.get('interface')
-                    
-                    # Remove from interfaces
-                    if interface and interface in self.state.get('interfaces', {}):
-                        if self.state['interfaces'][interface].get('container_id') == container_id:
-                            del self.state['interfaces'][interface]
-                            logger.info(f"Removed stale interface assignment: {interface}")
-                    
-                    del self.state['personas'][container_id]
+                    if interface in interfaces and interfaces[interface].get('container_id') == container_id:
+                        del interfaces[interface]
+                        logger.info(f"Removed stale interface assignment: {interface}")
             
-            # Clean up interfaces that reference non-existent or non-running containers
-            interfaces_to_remove = []
-            for interface, info in self.state.get('interfaces', {}).items():
-                container_id = info.get('container_id')
-                container_name = info.get('container_name')
-                if container_id and container_id not in actual_containers and container_name and container_name not in actual_containers:
-                    interfaces_to_remove.append(interface)
-                    logger.info(f"Cleaning up stale interface assignment: {interface} (container {container_name} doesn't exist)")
-                else:
-                    status = container_status.get(container_id) or container_status.get(container_name)
-                    if status and status != 'running':
-                        interfaces_to_remove.append(interface)
-                        logger.info(
-                            f"Cleaning up stale interface assignment: {interface} "
-                            f"(container {container_name} status: {status})"
-                        )
-            
-            for interface in interfaces_to_remove:
-                del self.state['interfaces'][interface]
+                # Interface assignments left without a persona entry
+                interfaces_removed = 0
+                for interface, info in list(interfaces.items()):
+                    container_name = info.get('container_name')
+                    reason = stale_reason(info.get('container_id'), container_name)
+                    if reason is None:
+                        continue
+                    logger.info(f"Cleaning up stale interface assignment: {interface} ({container_name}: {reason})")
+                    del interfaces[interface]
+                    interfaces_removed += 1
 
             # Remove exited/dead persona containers to keep Docker state clean across reboots.
+            # The listing may be a few seconds old, so re-check before removing anything.
+            removed_containers = False
             for container in all_containers:
+                if container.status == 'running':
+                    continue
                 try:
                     container.reload()
                     if container.status != 'running':
                         logger.info(f"Removing non-running persona container: {container.name} (status={container.status})")
                         container.remove(force=True)
+                        removed_containers = True
                 except Exception as e:
                     logger.debug(f"Could not remove non-running container {container.name}: {e}")
+            if removed_containers:
+                self.invalidate_container_cache()
             
-            if personas_to_remove or interfaces_to_remove:
+            if personas_removed or interfaces_removed:
+                self._reindex_interfaces()
                 self._save_state()
-                logger.info(f"Cleaned up {len(personas_to_remove)} stale persona(s) and {len(interfaces_to_remove)} stale interface assignment(s)")
+                logger.info(f"Cleaned up {personas_removed} stale persona(s) and {interfaces_removed} stale interface assignment(s)")
+            
+            return {**status_by_name, **status_by_id}
                 
         except Exception as e:
             logger.warning(f"Error cleaning up stale state: {e}")
+            return None
 
     def list_personas(self) -> List[Dict]:
         """List running persona containers only."""
-        # Clean up stale state first
-        self._cleanup_stale_state()
-        
-        personas = []
-        
         if not self._ensure_client():
             return []  # Return empty list if Docker unavailable
         
+        # Clean up stale state first; its container listing (already full inspect
+        # data) is reused below instead of listing and reloading every container again
+        self._cleanup_stale_state()
+        
         try:
-            # Get only running containers with our naming pattern
-            all_containers = self.client.containers.list(filters={'name': 'persona-'})
-            
-            for container in all_containers:
-                try:
-                    container.reload()
-                    attrs = container.attrs
-                    
-                    persona_info = {
-                        'id': container.id,
-                        'name': container.name,
-                        'status': attrs['State']['Status'],
-                        'created': attrs['Created'],
-                        'image': attrs['Config']['Image'],
-                    }
-                    env_vars = attrs.get('Config', {}).get('Env', []) or []
-                    env_map = {}
-                    for item in env_vars:
-                        if '=' in item:
-                            k, v = item.split('=', 1)
-                            env_map[k] = v
-                    persona_info['roaming_enabled'] = env_map.get('ROAMING_ENABLED', 'false').strip().lower() == 'true'
-                    persona_info['roaming_profile'] = env_map.get('ROAMING_PROFILE', 'standard')
-                    persona_info['roaming_mode'] = env_map.get('ROAMING_SELECTION_MODE', 'best')
-                    persona_info['roam_interval_seconds'] = env_map.get('ROAM_INTERVAL_SECONDS', '60')
-                    persona_info['roam_target_bssid'] = env_map.get('ROAM_TARGET_BSSID', '')
-                    persona_info['host_interface'] = env_map.get('HOST_INTERFACE')
-                    try:
-                        recent_logs = container.logs(tail=200, timestamps=False).decode('utf-8', errors='ignore')
-                        persona_info['health'] = self._extract_persona_health(recent_logs)
-                    except Exception:
-                        persona_info['health'] = self._extract_persona_health("")
-                    
-                    # Get interface assignment from state
-                    for iface, info in self.state.get('interfaces', {}).items():
-                        if info.get('container_id') == container.id:
-                            persona_info['interface'] = iface
-                            persona_info['persona_type'] = info.get('persona_type', 'unknown')
-                            persona_info['hostname'] = self.state.get('personas', {}).get(container.id, {}).get('hostname', 'unknown')
-                            break
-                    
-                    personas.append(persona_info)
-                except Exception as e:
-                    logger.warning(f"Error getting info for container {container.id}: {e}")
-                    
+            running = [c for c in self._get_persona_containers() if c.status == 'running']
+            # Each container costs a log fetch round trip; overlap them
+            return [info for info in self._executor.map(self._persona_info, running) if info is not None]
         except Exception as e:
             logger.error(f"Error listing personas: {e}")
-        
-        return personas
+            return []
+
+    def _persona_info(self, container) -> Optional[Dict]:
+        """Dashboard entry for one running persona container (None if it can't be read)."""
+        try:
+            attrs = container.attrs
+            
+            persona_info = {
+                'id': container.id,
+                'name': container.name,
+                'status': attrs['State']['Status'],
+                'created': attrs['Created'],
+                'image': attrs['Config']['Image'],
+            }
+            env_vars = attrs.get('Config', {}).get('Env', []) or []
+            env_map = {}
+            for item in env_vars:
+                if '=' in item:
+                    k, v = item.split('=', 1)
+                    env_map[k] = v
+            persona_info['roaming_enabled'] = env_map.get('ROAMING_ENABLED', 'false').strip().lower() == 'true'
+            persona_info['roaming_profile'] = env_map.get('ROAMING_PROFILE', 'standard')
+            persona_info['roaming_mode'] = env_map.get('ROAMING_SELECTION_MODE', 'best')
+            persona_info['roam_interval_seconds'] = env_map.get('ROAM_INTERVAL_SECONDS', '60')
+            persona_info['roam_target_bssid'] = env_map.get('ROAM_TARGET_BSSID', '')
+            persona_info['host_interface'] = env_map.get('HOST_INTERFACE')
+            try:
+                recent_logs = container.logs(tail=200, timestamps=False).decode('utf-8', errors='ignore')
+                persona_info['health'] = self._extract_persona_health(recent_logs)
+            except Exception:
+                persona_info['health'] = self._extract_persona_health("")
+            
+            # Get interface assignment from state
+            iface = self._iface_by_cid.get(container.id)
+            info = self.state['interfaces'].get(iface) if iface else None
+            if info is not None:
+                persona_info['interface'] = iface
+                persona_info['persona_type'] = info.get('persona_type', 'unknown')
+                persona_info['hostname'] = self.state['personas'].get(container.id, {}).get('hostname', 'unknown')
+            
+            return persona_info
+        except Exception as e:
+            logger.warning(f"Error getting info for container {container.id}: {e}")
+            return None
 
     def get_persona_logs(self, container_id: str, tail: int = 100) -> List[str]:
         """Get logs from a persona container."""
@@ -632,9 +792,21 @@ class PersonaManager:
             return []
         
         try:
-            container = self.client.containers.get(container_id)
-            logs = container.logs(tail=tail, timestamps=True).decode('utf-8')
-            return logs.split('\n')
+            # Low-level call: no containers.get() inspect round trip just to build a model
+            # Stream frames and keep only the last `tail` lines instead of decoding one large blob
+            # Docker treats a negative or non-int tail as "all"; mirror that rather than
+            # letting deque() reject it
+            if not isinstance(tail, int) or tail < 0:
+                tail = 'all'
+            lines = deque(maxlen=tail if tail != 'all' else None)
+            pending = b""
+            for chunk in self.client.api.logs(container_id, stream=True, follow=False, tail=tail, timestamps=True):
+                pending += chunk
+                *complete, pending = pending.split(b"\n")
+                lines.extend(line.decode('utf-8', errors='replace') for line in complete)
+            if pending:
+                lines.append(pending.decode('utf-8', errors='replace'))
+            return list(lines)
         except docker.errors.NotFound:
             return [f"Container {container_id} not found"]
         except Exception as e:
@@ -646,52 +818,80 @@ class PersonaManager:
         if not self._ensure_client():
             return {}
         
+        cached = self._stats_cache.get(container_id)
+        if cached and time.monotonic() - cached[0] < STATS_CACHE_TTL:
+            return cached[1]
+        
         try:
-            container = self.client.containers.get(container_id)
-            stats = container.stats(stream=False)
+            # A plain stats call makes dockerd wait ~1s for a second sample to fill precpu_stats.
+            # Once we hold an earlier sample of our own, a one-shot read plus that baseline suffices.
+            previous = self._cpu_samples.get(container_id)
+            if previous is not None and time.monotonic() - previous[0] >= CPU_BASELINE_MAX_AGE:
+                previous = None
+            stats = None
+            if previous is not None:
+                try:
+                    stats = self.client.api.stats(container_id, stream=False, one_shot=True)
+                    stats['precpu_stats'] = previous[1]
+                except docker.errors.InvalidVersion:
+                    pass  # daemon API < 1.41
+            if stats is None:
+                stats = self.client.api.stats(container_id, stream=False)
             
             # Extract useful metrics
             cpu_stats = stats.get('cpu_stats', {})
             mem_stats = stats.get('memory_stats', {})
+            self._cpu_samples[container_id] = (time.monotonic(), cpu_stats)
             
-            return {
-                'cpu_percent': self._calculate_cpu_percent(cpu_stats),
+            result = {
+                'cpu_percent': self._calculate_cpu_percent(cpu_stats, stats.get('precpu_stats', {})),
                 'memory_usage': mem_stats.get('usage', 0),
                 'memory_limit': mem_stats.get('limit', 0),
                 'network': stats.get('networks', {}),
             }
+            self._stats_cache[container_id] = (time.monotonic(), result)
+            return result
         except docker.errors.NotFound:
+            self._forget_stats(container_id)
             return {'error': 'Container not found'}
         except Exception as e:
             logger.error(f"Error getting stats: {e}")
             return {'error': str(e)}
 
-    def _calculate_cpu_percent(self, cpu_stats: Dict) -> float:
-        """Calculate CPU usage percentage from Docker stats."""
-        try:
-            cpu_delta = cpu_stats.get('cpu_usage', {}).get('total_usage', 0)
-            system_cpu = cpu_stats.get('system_cpu_usage', 0)
-            
-            if system_cpu > 0:
-                return (cpu_delta / system_cpu) * 100.0
-        except:
-            pass
-        return 0.0
+    def _forget_stats(self, container_id: str, container_name: Optional[str] = None):
+        """Drop cached stats and the CPU baseline for a container, whether keyed by name or (short) ID"""
+        for cache in (self._stats_cache, self._cpu_samples):
+            for key in list(cache):
+                if key == container_name or container_id.startswith(key):
+                    cache.pop(key, None)
+
+    def _calculate_cpu_percent(self, cpu_stats: Dict, precpu_stats: Dict) -> float:
+        """CPU usage percentage between two Docker stats samples (docker stats formula)."""
+        usage = cpu_stats.get('cpu_usage') or _EMPTY
+        cpu_delta = usage.get('total_usage', 0) - (precpu_stats.get('cpu_usage') or _EMPTY).get('total_usage', 0)
+        system_delta = (cpu_stats.get('system_cpu_usage') or 0) - (precpu_stats.get('system_cpu_usage') or 0)
+        if system_delta <= 0 or cpu_delta <= 0:
+            return 0.0
+        online_cpus = cpu_stats.get('online_cpus') or len(usage.get('percpu_usage') or ()) or 1
+        return (cpu_delta / system_delta) * online_cpus * 100.0
 
     def cleanup_all(self):
-        """Stop and remove all persona containers (graceful shutdown)."""
-        personas = self.list_personas()
+        """Stop and remove all persona containers (shutdown), stopping them concurrently."""
+        personas = [p for p in self.list_personas() if p['status'] in ['running', 'restarting']]
         results = []
         
-        for persona in personas:
-            if persona['status'] in ['running', 'restarting']:
-                success, msg = self.stop_persona(container_id=persona['id'])
-                results.append({
-                    'container': persona['name'],
-                    'success': success,
-                    'message': msg
-                })
+        outcomes = self._executor.map(lambda p: self.stop_persona(container_id=p['id']), personas)
+        for persona, (success, msg) in zip(personas, outcomes):
+            results.append({
+                'container': persona['name'],
+                'success': success,
+                'message': msg
+            })
         
+        # Nothing is left to poll; also drops entries for personas that exited on their own
+        self._stats_cache.clear()
+        self._cpu_samples.clear()
+        self.flush_state()
         return results
 
     def restore_from_state(self):
@@ -702,7 +902,7 @@ class PersonaManager:
         # restore with the same SSID/password from config
         restored = []
         
-        for container_id, persona_info in self.state.get('personas', {}).items():
+        for container_id, persona_info in self.state['personas'].items():
             if persona_info.get('status') == 'running':
                 # Check if container still exists
                 if not self._ensure_client():